@@ -0,0 +1,163 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+@author : Aymen Brahim Djelloul
+version : 0.1
+date    : 15.10.2026
+license : MIT
+
+
+    \\ This file contain the move legality kernels. They only take and return
+     integers (bitboards and square indexes), so they never touch a Piece object.
+
+"""
+
+# IMPORTS
+import sys
+from .bitboard import (RAY_ATTACKS, KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES, PAWN_DOUBLE_PUSHES,
+                       ray_attacks, rook_attacks, bishop_attacks)
+from typing import Tuple, Dict
+
+
+def piece_targets(symbol: str, sq: int, color: int, occupied: int, own: int) -> int:
+    """
+    Get the pseudo-legal target squares of a piece (castling excluded).
+
+    :param symbol: One-letter piece symbol ('p', 'n', 'b', 'r', 'q' or 'k')
+    :param sq: Index of the piece square
+    :param color: Color of the piece
+    :param occupied: Occupancy of both colors
+    :param own: Occupancy of the piece's color
+    :return: Bitboard of the squares the piece can move to
+    """
+    if symbol == 'p':
+        # Pushes need empty squares, the double push also needs the single one free
+        empty = ~occupied
+        targets = PAWN_PUSHES[color][sq] & empty
+        if targets:
+            targets |= PAWN_DOUBLE_PUSHES[color][sq] & empty
+        return targets | (PAWN_ATTACKS[color][sq] & occupied & ~own)
+
+    if symbol == 'n':
+        targets = KNIGHT_ATTACKS[sq]
+    elif symbol == 'k':
+        targets = KING_ATTACKS[sq]
+    elif symbol == 'r':
+        targets = rook_attacks(sq, occupied)
+    elif symbol == 'b':
+        targets = bishop_attacks(sq, occupied)
+    else:
+        targets = rook_attacks(sq, occupied) | bishop_attacks(sq, occupied)
+
+    return targets & ~own
+
+
+def is_square_attacked(sq: int, occupied: int, pawns: int, knights: int, diagonal: int,
+                       orthogonal: int, king: int, pawn_attacks: Tuple[int, ...]) -> bool:
+    """
+    Check if a square is attacked by the given attacker bitboards.
+
+    :param sq: Index of the attacked square
+    :param occupied: Occupancy of both colors
+    :param pawns: Attacking pawns
+    :param knights: Attacking knights
+    :param diagonal: Attacking bishops and queens
+    :param orthogonal: Attacking rooks and queens
+    :param king: Attacking king
+    :param pawn_attacks: Pawn attack table of the defending color
+    :return: True if any attacker reaches the square
+    """
+    # Leapers: look up which squares could attack this one
+    if KNIGHT_ATTACKS[sq] & knights or KING_ATTACKS[sq] & king:
+        return True
+    # A pawn attacks sq from the squares a defending pawn standing on sq would attack
+    if pawn_attacks[sq] & pawns:
+        return True
+
+    # Sliders: look for an attacker at the end of the rook and bishop rays out of sq
+    if orthogonal and rook_attacks(sq, occupied) & orthogonal:
+        return True
+    if diagonal and bishop_attacks(sq, occupied) & diagonal:
+        return True
+
+    return False
+
+
+def is_king_move_safe(from_sq: int, to_sq: int, occupied: int, pawns: int, knights: int, diagonal: int,
+                      orthogonal: int, king: int, pawn_attacks: Tuple[int, ...]) -> bool:
+    """
+    Check if a king can move from from_sq to to_sq without standing in check,
+    without playing the move on a board.
+
+    :param from_sq: Index of the king square
+    :param to_sq: Index of the target square
+    :param occupied: Occupancy of both colors
+    :param pawns: Enemy pawns
+    :param knights: Enemy knights
+    :param diagonal: Enemy bishops and queens
+    :param orthogonal: Enemy rooks and queens
+    :param king: Enemy king
+    :param pawn_attacks: Pawn attack table of the king's color
+    :return: True if the target square is not attacked once the king stands on it
+    """
+    to_bb = 1 << to_sq
+    # A piece captured on the target square no longer attacks
+    survivors = ~to_bb
+    # The king leaves its square, so sliders can see through it
+    occupied = (occupied & ~(1 << from_sq)) | to_bb
+
+    return not is_square_attacked(to_sq, occupied, pawns & survivors, knights & survivors,
+                                  diagonal & survivors, orthogonal & survivors, king, pawn_attacks)
+
+
+def king_info(king_sq: int, occupied: int, own: int, pawns: int, knights: int, diagonal: int,
+              orthogonal: int, pawn_attacks: Tuple[int, ...]) -> Tuple[int, int, int, Dict[int, int]]:
+    """
+    Compute the check and pin information around a king.
+
+    :param king_sq: Index of the king square
+    :param occupied: Occupancy of both colors
+    :param own: Occupancy of the king's color
+    :param pawns: Enemy pawns
+    :param knights: Enemy knights
+    :param diagonal: Enemy bishops and queens
+    :param orthogonal: Enemy rooks and queens
+    :param pawn_attacks: Pawn attack table of the king's color
+    :return: (checkers, check_mask, pinned, pin_rays) where checkers is the bitboard
+             of enemy pieces giving check, check_mask the squares that resolve a single
+             check (checker plus the squares in between), pinned the bitboard of own
+             pinned pieces and pin_rays maps a pinned square to the ray it may move on
+    """
+    # Knights and pawns can only give check, never pin
+    checkers = (KNIGHT_ATTACKS[king_sq] & knights) | (pawn_attacks[king_sq] & pawns)
+    check_mask = checkers
+    pinned = 0
+    pin_rays = {}
+
+    # Look along the 8 rays from the king for sliding checkers and pinners
+    for direction in range(8):
+        sliders = orthogonal if direction < 4 else diagonal
+        if not sliders & RAY_ATTACKS[king_sq][direction]:
+            continue  # No enemy slider on this ray at all
+
+        attacks = ray_attacks(king_sq, direction, occupied)
+        blocker = attacks & occupied
+
+        if blocker & sliders:
+            checkers |= blocker
+            check_mask |= attacks
+        elif blocker & own:
+            # X-ray through the own blocker: a slider behind it pins it
+            xray = ray_attacks(king_sq, direction, occupied ^ blocker)
+            if xray & occupied & sliders:
+                pinned |= blocker
+                pin_rays[blocker.bit_length() - 1] = xray
+
+    return checkers, check_mask, pinned, pin_rays
+
+
+if __name__ == "__main__":
+    sys.exit(0)
@@ -0,0 +1,193 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+@author : Aymen Brahim Djelloul
+version : 0.1
+date    : 15.10.2026
+license : MIT
+
+
+    \\ This file contain the bitboard helpers used by the game logic.
+     A square index is 'row * 8 + col', so a8 is bit 0 and h1 is bit 63.
+
+"""
+
+# IMPORTS
+import sys
+from .const import BOARD_SIZE, ROOK_DELTAS, BISHOP_DELTAS, KING_DELTAS, KNIGHT_DELTAS
+from typing import Tuple, Dict, Iterator
+
+# DEFINE SQUARE INDEX TABLES
+SQ: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(row * BOARD_SIZE + col for col in range(BOARD_SIZE)) for row in range(BOARD_SIZE)
+)
+POSITIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+)
+SQUARE_BB: Tuple[int, ...] = tuple(1 << sq for sq in range(BOARD_SIZE * BOARD_SIZE))
+
+
+def iter_squares(bb: int) -> Iterator[int]:
+    """Yield the index of every set bit of a bitboard, lowest first."""
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+# DEFINE STARTING POSITION BITBOARDS (keyed by color letter + piece symbol)
+START_BITBOARDS: dict = {
+    'wp': 0x00FF000000000000, 'wn': 0x4200000000000000, 'wb': 0x2400000000000000,
+    'wr': 0x8100000000000000, 'wq': 0x0800000000000000, 'wk': 0x1000000000000000,
+    'bp': 0x000000000000FF00, 'bn': 0x0000000000000042, 'bb': 0x0000000000000024,
+    'br': 0x0000000000000081, 'bq': 0x0000000000000008, 'bk': 0x0000000000000010,
+}
+START_WHITE: int = 0xFFFF000000000000
+START_BLACK: int = 0x000000000000FFFF
+
+# DEFINE RAY DELTAS (the first four are orthogonal, the last four diagonal)
+SLIDER_DELTAS: Tuple[int, ...] = ROOK_DELTAS + BISHOP_DELTAS
+
+
+def _step(sq: int, delta: int, max_col_step: int) -> int:
+    """Return the square reached from sq by delta, or -1 if it leaves the board (or wraps a row)."""
+    target = sq + delta
+    if 0 <= target < 64 and abs((target & 7) - (sq & 7)) <= max_col_step:
+        return target
+    return -1
+
+
+def _build_rays() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Build RAYS[sq][direction], the squares met walking from sq to the board edge."""
+    rays = []
+    for sq in range(64):
+        square_rays = []
+        for delta in SLIDER_DELTAS:
+            ray = []
+            target = _step(sq, delta, 1)
+            while target != -1:
+                ray.append(target)
+                target = _step(target, delta, 1)
+            square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+def _build_leaper_attacks(deltas: Tuple[int, ...], max_col_step: int) -> Tuple[int, ...]:
+    """Build the attack bitboard of a piece jumping by the given deltas, for every square."""
+    attacks = []
+    for sq in range(64):
+        bb = 0
+        for delta in deltas:
+            target = _step(sq, delta, max_col_step)
+            if target != -1:
+                bb |= SQUARE_BB[target]
+        attacks.append(bb)
+    return tuple(attacks)
+
+
+RAYS = _build_rays()
+# Full ray bitboards, RAY_ATTACKS[sq][direction]
+RAY_ATTACKS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sum(SQUARE_BB[ray_sq] for ray_sq in ray) for ray in square_rays) for square_rays in RAYS
+)
+# Rays going towards higher square indexes meet their first blocker on the lowest set bit
+_POSITIVE_RAY: Tuple[bool, ...] = tuple(delta > 0 for delta in SLIDER_DELTAS)
+KNIGHT_ATTACKS: Tuple[int, ...] = _build_leaper_attacks(KNIGHT_DELTAS, 2)
+KING_ATTACKS: Tuple[int, ...] = _build_leaper_attacks(KING_DELTAS, 1)
+# The same leaper targets as square index lists, for the board-list move generators
+KNIGHT_TARGETS: Tuple[Tuple[int, ...], ...] = tuple(tuple(iter_squares(bb)) for bb in KNIGHT_ATTACKS)
+KING_TARGETS: Tuple[Tuple[int, ...], ...] = tuple(tuple(iter_squares(bb)) for bb in KING_ATTACKS)
+# Squares attacked by a pawn of the given color standing on each square, indexed by color
+PAWN_ATTACKS: Tuple[Tuple[int, ...], ...] = (
+    _build_leaper_attacks((-9, -7), 1),  # WHITE
+    _build_leaper_attacks((7, 9), 1),  # BLACK
+)
+# Single pawn pushes, and double pushes from the starting row (0 elsewhere), indexed by color
+PAWN_PUSHES: Tuple[Tuple[int, ...], ...] = (
+    _build_leaper_attacks((-8,), 0),  # WHITE
+    _build_leaper_attacks((8,), 0),  # BLACK
+)
+PAWN_DOUBLE_PUSHES: Tuple[Tuple[int, ...], ...] = (
+    tuple(SQUARE_BB[sq - 16] if 48 <= sq < 56 else 0 for sq in range(64)),  # WHITE
+    tuple(SQUARE_BB[sq + 16] if 8 <= sq < 16 else 0 for sq in range(64)),  # BLACK
+)
+# The same pawn tables as square index lists, for the board-list move generators.
+# Push targets are ordered single push first, so a blocked square stops the double push
+PAWN_PUSH_TARGETS: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(iter_squares(PAWN_PUSHES[color][sq])) + tuple(iter_squares(PAWN_DOUBLE_PUSHES[color][sq]))
+          for sq in range(64)) for color in range(2)
+)
+PAWN_CAPTURE_TARGETS: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(iter_squares(bb)) for bb in PAWN_ATTACKS[color]) for color in range(2)
+)
+
+
+def ray_attacks(sq: int, direction: int, occupied: int) -> int:
+    """Get the squares attacked from sq along one direction, up to and including the first blocker."""
+    ray = RAY_ATTACKS[sq][direction]
+    blockers = ray & occupied
+    if blockers:
+        if _POSITIVE_RAY[direction]:
+            first = (blockers & -blockers).bit_length() - 1
+        else:
+            first = blockers.bit_length() - 1
+        # Cut off everything behind the first blocker
+        ray ^= RAY_ATTACKS[first][direction]
+    return ray
+
+
+def _build_line_tables(first: int, second: int) -> Tuple[Tuple[int, ...], Tuple[Dict[int, int], ...]]:
+    """
+    Build the hashed attack tables of one line (two opposite ray directions) for every square.
+
+    The relevant occupancy of a square is its line without the board edges, since a
+    blocker on the last square of a ray changes nothing. The table of a square maps
+    every subset of that occupancy to the attacks along the line.
+    """
+    masks = []
+    tables = []
+    for sq in range(64):
+        mask = 0
+        for direction in (first, second):
+            ray = RAYS[sq][direction]
+            for ray_sq in ray[:-1]:
+                mask |= SQUARE_BB[ray_sq]
+
+        table = {}
+        subset = 0
+        while True:
+            # Walk every subset of the mask (carry-rippler trick)
+            table[subset] = ray_attacks(sq, first, subset) | ray_attacks(sq, second, subset)
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+
+        masks.append(mask)
+        tables.append(table)
+    return tuple(masks), tuple(tables)
+
+
+# DEFINE HASHED SLIDING ATTACK TABLES (one lookup per line instead of a ray walk)
+FILE_MASKS, FILE_ATTACKS = _build_line_tables(0, 1)
+RANK_MASKS, RANK_ATTACKS = _build_line_tables(2, 3)
+DIAGONAL_MASKS, DIAGONAL_ATTACKS = _build_line_tables(4, 7)
+ANTI_DIAGONAL_MASKS, ANTI_DIAGONAL_ATTACKS = _build_line_tables(5, 6)
+
+
+def rook_attacks(sq: int, occupied: int) -> int:
+    """Get the squares attacked by a rook on sq."""
+    return FILE_ATTACKS[sq][occupied & FILE_MASKS[sq]] | RANK_ATTACKS[sq][occupied & RANK_MASKS[sq]]
+
+
+def bishop_attacks(sq: int, occupied: int) -> int:
+    """Get the squares attacked by a bishop on sq."""
+    return (DIAGONAL_ATTACKS[sq][occupied & DIAGONAL_MASKS[sq]] |
+            ANTI_DIAGONAL_ATTACKS[sq][occupied & ANTI_DIAGONAL_MASKS[sq]])
+
+
+if __name__ == "__main__":
+    sys.exit(0)
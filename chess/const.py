@@ -14,18 +14,6 @@ license : MIT License
 
 # IMPORTS
 import sys
-import configparser
-from time import perf_counter
-from pathlib import Path
-
-try:
-    from PyQt5.QtGui import QColor
-
-except ImportError:
-    QColor = None
-
-# DEFINE START TIME OF EXECUTION
-S_TIME: float = perf_counter()
 
 # DEFINE GLOBAL VARIABLES
 AUTHOR: str = "Aymen Brahim Djelloul"
@@ -42,8 +30,21 @@ SQSize: int = min(WIDTH, HEIGHT) // BOARD_SIZE
 OFFSET_X: int = (WIDTH - BOARD_SIZE * SQSize) // 2
 OFFSET_Y: int = (HEIGHT - BOARD_SIZE * SQSize) // 2
 
-# DEFINE ROOK MOVE DIRECTIONS
-ROOK_DIRECTIONS: list = [(1, 0), (6, 0), (1, 7), (6, 7)]
+# DEFINE COLORS (the enemy of a color is 'color ^ 1') AND CASTLING SIDES
+WHITE: int = 0
+BLACK: int = 1
+COLOR_NAMES: tuple = ("white", "black")
+KINGSIDE: int = 0
+QUEENSIDE: int = 1
+
+# DEFINE PIECE SYMBOLS (a bitboard key is the color letter followed by the symbol)
+PIECE_SYMBOLS: str = 'pnbrqk'
+
+# DEFINE MOVE DELTAS (as square index offsets, square = row * 8 + col)
+ROOK_DELTAS: tuple = (-8, 8, -1, 1)
+BISHOP_DELTAS: tuple = (-9, -7, 7, 9)
+KING_DELTAS: tuple = ROOK_DELTAS + BISHOP_DELTAS
+KNIGHT_DELTAS: tuple = (-17, -15, -10, -6, 6, 10, 15, 17)
 
 # DEFINE RGB COLORS
 SELECTED_COLOR: tuple = (206, 206, 206)
@@ -54,7 +55,7 @@ CHECKMATE_COLOR: tuple = (230, 90, 90)
 GREEN_COLOR: tuple = (118, 150, 86)
 WHITE_COLOR: tuple = (238, 238, 210)
 
-APP_ICON = Path("assets/images/icons/icon.png")
+APP_ICON: str = "assets/images/icons/icon.png"
 
 # Define urls
 DEEP_CORE_REPO: str = "https://github.com/aymenbrahimdjelloul/deepcore"
@@ -77,21 +78,40 @@ BLACK_KNIGHT: str = "♞"
 BLACK_QUEEN: str = "♛"
 BLACK_KING: str = "♚"
 
+# Piece glyphs keyed by piece symbol, indexed by color
+TEXTURES: dict = {
+    'p': (WHITE_PAWN, BLACK_PAWN),
+    'n': (WHITE_KNIGHT, BLACK_KNIGHT),
+    'b': (WHITE_BISHOP, BLACK_BISHOP),
+    'r': (WHITE_ROOK, BLACK_ROOK),
+    'q': (WHITE_QUEEN, BLACK_QUEEN),
+    'k': (WHITE_KING, BLACK_KING),
+}
+
 # DEFINE SOUNDS FILES
 MOVE_SOUND: str = "assets/sounds/move.wav"
 CAPTURE_SOUND: str = "assets/sounds/capture.wav"
 
-# DEFINE SETTINGS
-SETTINGS: configparser.ConfigParser = configparser.ConfigParser()
-SETTINGS = SETTINGS.read('settings.ini')
-
-# Enhanced colors for a professional look
-DARK_SQUARE = QColor(181, 136, 99)  # Warm brown for dark squares
-LIGHT_SQUARE = QColor(240, 217, 181)  # Light beige for light squares
-HIGHLIGHT_COLOR = QColor(106, 168, 79, 180)  # Green highlight for pieces
-MOVE_COLOR = QColor(106, 168, 79, 120)  # Lighter green for possible moves
-BACKGROUND_COLOR = QColor(42, 39, 37)  # Dark charcoal background
-PANEL_COLOR = QColor(55, 52, 50)  # Panel background
+# DEFINE SETTINGS FILES (read on demand by 'Settings.load_settings', the ini file is
+# only read once to migrate older installs to json)
+SETTINGS_FILE: str = "settings.json"
+LEGACY_SETTINGS_FILE: str = "settings.ini"
+
+# DEFINE UPDATE CHECK (the cache file keeps the release ETag, so unchanged releases cost a 304).
+# The cache file lives in the 'CONFIG_DIR_NAME' folder of the user config directory
+LATEST_RELEASE_API: str = "https://api.github.com/repos/aymenbrahimdjelloul/deepcore/releases/latest"
+CONFIG_DIR_NAME: str = "deepcore"
+UPDATE_CACHE_FILE: str = "update_cache.json"
+UPDATE_TIMEOUT: int = 5
+
+# Enhanced colors for a professional look, as RGBA tuples. The interface turns
+# them into QColor objects, so the game logic can be imported without PyQt5
+DARK_SQUARE_RGBA: tuple = (181, 136, 99, 255)  # Warm brown for dark squares
+LIGHT_SQUARE_RGBA: tuple = (240, 217, 181, 255)  # Light beige for light squares
+HIGHLIGHT_COLOR_RGBA: tuple = (106, 168, 79, 180)  # Green highlight for pieces
+MOVE_COLOR_RGBA: tuple = (106, 168, 79, 120)  # Lighter green for possible moves
+BACKGROUND_COLOR_RGBA: tuple = (42, 39, 37, 255)  # Dark charcoal background
+PANEL_COLOR_RGBA: tuple = (55, 52, 50, 255)  # Panel background
 
 # Button style for a modern look
 BUTTON_STYLE: str = """
@@ -111,6 +131,71 @@ BUTTON_STYLE: str = """
     }
 """
 
+# Game over dialog style (iOS-style clean white/gray styling)
+GAME_OVER_STYLE: str = """
+    QMessageBox {
+        background-color: rgba(255, 255, 255, 0.95);
+        border: none;
+        border-radius: 14px;
+        min-width: 280px;
+        max-width: 320px;
+        min-height: 140px;
+    }
+
+    QMessageBox QLabel {
+        background: transparent;
+        color: #1c1c1e;
+        border: none;
+        padding: 20px 16px 16px 16px;
+    }
+
+    QPushButton {
+        background-color: transparent;
+        color: #007aff;
+        border: none;
+        border-top: 0.5px solid rgba(60, 60, 67, 0.29);
+        border-radius: 0px;
+        padding: 16px 12px;
+        font-size: 17px;
+        font-weight: 400;
+        min-height: 44px;
+    }
+
+    QPushButton:hover {
+        background-color: rgba(0, 122, 255, 0.05);
+    }
+
+    QPushButton:pressed {
+        background-color: rgba(0, 122, 255, 0.1);
+    }
+
+    QPushButton:default {
+        color: #007aff;
+        font-weight: 600;
+    }
+
+    QPushButton:default:hover {
+        background-color: rgba(0, 122, 255, 0.05);
+    }
+
+    QPushButton:default:pressed {
+        background-color: rgba(0, 122, 255, 0.1);
+    }
+
+    QPushButton:first-child {
+        border-bottom-left-radius: 14px;
+    }
+
+    QPushButton:last-child {
+        border-bottom-right-radius: 14px;
+    }
+
+    QPushButton:only-child {
+        border-bottom-left-radius: 14px;
+        border-bottom-right-radius: 14px;
+    }
+"""
+
 # Define the HTML content for the main text
 ABOUT_TEXT: str = f"""
 <h2>DeepCore Chess</h2>
@@ -123,5 +208,25 @@ AI opponents, and game analysis tools.</p>
 
 LINKS_TEXT: str = f"<p><a href='{DEEP_CORE_WEBSITE}'>Visit website</a> | <a href='{DEEP_CORE_REPO}'>GitHub</a></p>"
 
+# Define the keyboard shortcuts help text
+SHORTCUTS_TEXT: str = (
+    "File Operations:\n"
+    "• Ctrl+N: New Game\n"
+    "• Ctrl+O: Open Game\n"
+    "• Ctrl+S: Save Game\n"
+    "• Ctrl+Q: Exit\n\n"
+
+    "Game Controls:\n"
+    "• Ctrl+Z: Undo Move\n"
+    "• Ctrl+Y: Redo Move\n"
+    "• F11: Toggle Fullscreen\n\n"
+
+    "Settings:\n"
+    "• Ctrl+,: Open Preferences\n\n"
+
+    "View:\n"
+    "• F11: Fullscreen Mode"
+)
+
 if __name__ == "__main__":
     sys.exit(0)
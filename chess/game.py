@@ -13,11 +13,13 @@ license : MIT
 # IMPORTS
 from .pieces import *
 from .const import *
+from .bitboard import SQ, POSITIONS, SQUARE_BB, START_BITBOARDS, START_WHITE, START_BLACK, PAWN_ATTACKS, iter_squares
+from ._movegen import piece_targets, is_square_attacked, is_king_move_safe, king_info as compute_king_info
+from .zobrist import PIECE_KEYS, hash_board
 import sys
-from typing import Optional, Tuple, List, Dict, Union
+from typing import Optional, Tuple, List, Dict, Union, Iterator
 from enum import Enum
 from dataclasses import dataclass
-from copy import deepcopy
 
 
 class GameState(Enum):
@@ -41,6 +43,9 @@ class Move:
     is_en_passant: bool = False
     is_promotion: bool = False
     promoted_to: Optional[str] = None
+    # State the move overwrites, restored by undo_move
+    prev_castling_rights: Optional[List[bool]] = None
+    prev_halfmove_clock: int = 0
 
     def __str__(self) -> str:
         """String representation of the move."""
@@ -49,27 +54,104 @@ class Move:
         return f"{from_notation}-{to_notation}"
 
 
+# Castling right (index into Game.castling_rights) lost when a rook leaves
+# (or is captured on) its starting square
+_ROOK_SQ_TO_RIGHT: Dict[Tuple[int, int], int] = {
+    (0, 0): BLACK * 2 + QUEENSIDE,
+    (0, 7): BLACK * 2 + KINGSIDE,
+    (7, 0): WHITE * 2 + QUEENSIDE,
+    (7, 7): WHITE * 2 + KINGSIDE,
+}
+
+# Squares between king and rook that must be empty to castle, indexed by color * 2 + side.
+# On the queenside that includes the b-file square, which only the rook crosses
+_CASTLE_EMPTY_MASKS: Tuple[int, ...] = (
+    0x6000000000000000,  # WHITE, KINGSIDE: f1, g1
+    0x0E00000000000000,  # WHITE, QUEENSIDE: b1, c1, d1
+    0x0000000000000060,  # BLACK, KINGSIDE: f8, g8
+    0x000000000000000E,  # BLACK, QUEENSIDE: b8, c8, d8
+)
+# Squares the king crosses or lands on, which must not be attacked, indexed by color * 2 + side
+_CASTLE_SAFE_SQUARES: Tuple[Tuple[Tuple[int, int], ...], ...] = (
+    ((7, 5), (7, 6)),
+    ((7, 2), (7, 3)),
+    ((0, 5), (0, 6)),
+    ((0, 2), (0, 3)),
+)
+
+
+# Move flags, stored in the low 4 bits of a packed move
+MOVE_CAPTURE: int = 1
+MOVE_PROMOTION: int = 2
+MOVE_CASTLING: int = 4
+MOVE_EN_PASSANT: int = 8
+
+
+def pack_move(from_sq: int, to_sq: int, flags: int = 0) -> int:
+    """Pack a move into a single int: from square, to square and flags."""
+    return (from_sq << 10) | (to_sq << 4) | flags
+
+
+def unpack_move(move: int) -> Tuple[Tuple[int, int], Tuple[int, int], int]:
+    """Unpack a packed move into (from_pos, to_pos, flags)."""
+    return POSITIONS[move >> 10], POSITIONS[(move >> 4) & 63], move & 15
+
+
+def _build_starting_board() -> List[Optional[Piece]]:
+    """Build the initial chess board setup, a list of 64 squares indexed by row * 8 + col."""
+    board = [None] * (BOARD_SIZE * BOARD_SIZE)
+
+    # Define piece placement for back ranks
+    piece_order = [Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook]
+
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            if row == 0:  # Black pieces back rank
+                board[SQ[row][col]] = piece_instance(piece_order[col], BLACK)
+            elif row == 1:  # Black pawns
+                board[SQ[row][col]] = piece_instance(Pawn, BLACK)
+            elif row == 6:  # White pawns
+                board[SQ[row][col]] = piece_instance(Pawn, WHITE)
+            elif row == 7:  # White pieces back rank
+                board[SQ[row][col]] = piece_instance(piece_order[col], WHITE)
+
+    return board
+
+
+# DEFINE THE STARTING POSITION ONCE
+_STARTING_BOARD: List[Optional[Piece]] = _build_starting_board()
+_STARTING_ZOBRIST: int = hash_board(_STARTING_BOARD)
+
+
 class Game:
     """Main chess game class that manages the game state and rules."""
 
     def __init__(self):
         # Game state variables
-        self.current_turn: str = 'white'
+        self.current_turn: int = WHITE
         self.move_history: List[Move] = []
-        self.board: Dict[Tuple[int, int], Optional[Piece]] = self.create_board()
+        self.board: List[Optional[Piece]] = self.create_board()
         self.game_state: GameState = GameState.ACTIVE
 
+        # Bitboards mirroring the board, one per piece key plus one occupancy per color
+        self.bitboards: Dict[str, int] = dict(START_BITBOARDS)
+        self.occupancy: List[int] = [START_WHITE, START_BLACK]
+
+        # Zobrist hash of the piece placement, updated incrementally
+        self.zobrist: int = _STARTING_ZOBRIST
+
+        # Checkers / pins around each king, computed once per position
+        self._king_info: Dict[int, tuple] = {}
+
+        # Legal moves of the last generated position, keyed by (zobrist, color)
+        self._legal_cache: Optional[Tuple[Tuple[int, int], list]] = None
+
         # King positions for efficient check detection
         self.white_king_pos: Tuple[int, int] = (7, 4)
         self.black_king_pos: Tuple[int, int] = (0, 4)
 
-        # Castling rights
-        self.castling_rights = {
-            'white_kingside': True,
-            'white_queenside': True,
-            'black_kingside': True,
-            'black_queenside': True
-        }
+        # Castling rights, indexed by color * 2 + side
+        self.castling_rights: List[bool] = [True, True, True, True]
 
         # En passant target square
         self.en_passant_target: Optional[Tuple[int, int]] = None
@@ -79,92 +161,148 @@ class Game:
         self.fullmove_number = 1  # Full moves in the game
 
     @staticmethod
-    def create_board() -> Dict[Tuple[int, int], Optional[Piece]]:
+    def create_board() -> List[Optional[Piece]]:
         """Create and return the initial chess board setup."""
-        board = {}
-
-        # Define piece placement for back ranks
-        piece_order = [Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook]
-
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                if row == 0:  # Black pieces back rank
-                    board[(row, col)] = piece_order[col]('black')
-                elif row == 1:  # Black pawns
-                    board[(row, col)] = Pawn('black')
-                elif row == 6:  # White pawns
-                    board[(row, col)] = Pawn('white')
-                elif row == 7:  # White pieces back rank
-                    board[(row, col)] = piece_order[col]('white')
-                else:  # Empty squares
-                    board[(row, col)] = None
-
-        return board
+        # Pieces are shared flyweights, so a shallow copy is a full copy
+        return list(_STARTING_BOARD)
 
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if a position is within the board boundaries."""
         return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
 
     def get_piece(self, position: Tuple[int, int]) -> Optional[Piece]:
-        """Get the piece at the given position."""
-        return self.board.get(position)
+        """Get the piece at the given position, None if empty or off the board."""
+        row, col = position
+        if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+            return self.board[SQ[row][col]]
+        return None
+
+    def iter_pieces(self, color: int) -> Iterator[Tuple[Tuple[int, int], Piece]]:
+        """
+        Yield (position, piece) for every piece of the given color. The occupancy
+        bitboard is the piece list, so empty squares are never visited.
+        """
+        board = self.board
+        for sq in iter_squares(self.occupancy[color]):
+            yield POSITIONS[sq], board[sq]
 
     def is_square_empty(self, position: Tuple[int, int]) -> bool:
         """Check if a square is empty."""
-        return self.get_piece(position) is None
+        mask = SQUARE_BB[SQ[position[0]][position[1]]]
+        return not ((self.occupancy[WHITE] | self.occupancy[BLACK]) & mask)
 
-    def is_enemy_piece(self, position: Tuple[int, int], color: str) -> bool:
+    def is_enemy_piece(self, position: Tuple[int, int], color: int) -> bool:
         """Check if there's an enemy piece at the given position."""
-        piece = self.get_piece(position)
-        return piece is not None and piece.color != color
+        return bool(self.occupancy[color ^ 1] & SQUARE_BB[SQ[position[0]][position[1]]])
 
-    def is_own_piece(self, position: Tuple[int, int], color: str) -> bool:
+    def is_own_piece(self, position: Tuple[int, int], color: int) -> bool:
         """Check if there's an own piece at the given position."""
-        piece = self.get_piece(position)
-        return piece is not None and piece.color == color
+        return bool(self.occupancy[color] & SQUARE_BB[SQ[position[0]][position[1]]])
+
+    def _set_square(self, position: Tuple[int, int], piece: Optional[Piece]) -> None:
+        """Put a piece (or None) on a square, keeping the bitboards in sync."""
+        sq = SQ[position[0]][position[1]]
+        mask = SQUARE_BB[sq]
+
+        old_piece = self.board[sq]
+        if old_piece is not None:
+            self.bitboards[old_piece.key] ^= mask
+            self.occupancy[old_piece.color] ^= mask
+            self.zobrist ^= PIECE_KEYS[old_piece.key][sq]
 
-    def get_king_position(self, color: str) -> Tuple[int, int]:
+        if piece is not None:
+            self.bitboards[piece.key] |= mask
+            self.occupancy[piece.color] |= mask
+            self.zobrist ^= PIECE_KEYS[piece.key][sq]
+
+        self.board[sq] = piece
+        self._king_info.clear()
+
+    def get_king_position(self, color: int) -> Tuple[int, int]:
         """Get the current position of the king for the given color."""
-        return self.white_king_pos if color == 'white' else self.black_king_pos
+        return self.white_king_pos if color == WHITE else self.black_king_pos
 
-    def update_king_position(self, color: str, new_position: Tuple[int, int]) -> None:
+    def update_king_position(self, color: int, new_position: Tuple[int, int]) -> None:
         """Update the stored king position."""
-        if color == 'white':
+        if color == WHITE:
             self.white_king_pos = new_position
         else:
             self.black_king_pos = new_position
 
-    def is_square_under_attack(self, position: Tuple[int, int], by_color: str) -> bool:
+    def is_square_under_attack(self, position: Tuple[int, int], by_color: int) -> bool:
         """Check if a square is under attack by pieces of the given color."""
-        for board_pos, piece in self.board.items():
-            if piece and piece.color == by_color:
-                possible_moves = piece.possible_moves(board_pos, self.board)
-                if position in possible_moves:
-                    return True
-        return False
-
-    def is_in_check(self, color: str) -> bool:
+        bitboards = self.bitboards
+        by = 'wb'[by_color]
+
+        return is_square_attacked(
+            SQ[position[0]][position[1]],
+            self.occupancy[WHITE] | self.occupancy[BLACK],
+            bitboards[by + 'p'],
+            bitboards[by + 'n'],
+            bitboards[by + 'b'] | bitboards[by + 'q'],
+            bitboards[by + 'r'] | bitboards[by + 'q'],
+            bitboards[by + 'k'],
+            PAWN_ATTACKS[by_color ^ 1]
+        )
+
+    def is_in_check(self, color: int) -> bool:
         """Check if the king of the given color is in check."""
+        return self.is_square_under_attack(self.get_king_position(color), color ^ 1)
+
+    def iter_possible_moves(self, color: int) -> Iterator[int]:
+        """Yield the possible moves for pieces of the given color, as packed moves, one piece at a time."""
+        bitboards = self.bitboards
+        prefix = 'wb'[color]
+        own_occupancy = self.occupancy[color]
+        enemy_occupancy = self.occupancy[color ^ 1]
+        occupied = own_occupancy | enemy_occupancy
+
+        # Pawns promote when they reach the last row
+        promotion_squares = 0x00000000000000FF if color == WHITE else 0xFF00000000000000
+
+        # The piece bitboards give type and color, so the Piece list is never touched here
+        for symbol in PIECE_SYMBOLS:
+            promotion = MOVE_PROMOTION if symbol == 'p' else 0
+
+            for from_sq in iter_squares(bitboards[prefix + symbol]):
+                targets = piece_targets(symbol, from_sq, color, occupied, own_occupancy)
+
+                for to_sq in iter_squares(targets):
+                    to_bb = SQUARE_BB[to_sq]
+                    flags = MOVE_CAPTURE if enemy_occupancy & to_bb else 0
+                    if promotion_squares & to_bb:
+                        flags |= promotion
+                    yield (from_sq << 10) | (to_sq << 4) | flags
+
+    def get_all_possible_moves(self, color: int) -> List[int]:
+        """Get all possible moves for pieces of the given color, as packed moves."""
+        return list(self.iter_possible_moves(color))
+
+    def _get_king_info(self, color: int) -> Tuple[int, int, int, Dict[int, int]]:
+        """
+        Get the check and pin information around the king of the given color,
+        computed once per position (see _movegen.king_info for the returned tuple).
+        """
+        king_info = self._king_info.get(color)
+        if king_info is not None:
+            return king_info
+
+        enemy = 'wb'[color ^ 1]
+        bitboards = self.bitboards
         king_pos = self.get_king_position(color)
-        enemy_color = 'black' if color == 'white' else 'white'
-        return self.is_square_under_attack(king_pos, enemy_color)
-
-    def get_all_possible_moves(self, color: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """Get all possible moves for pieces of the given color."""
-        all_moves = []
-        for position, piece in self.board.items():
-            if piece and piece.color == color:
-                possible_moves = piece.possible_moves(position, self.board)
-                for move in possible_moves:
-                    all_moves.append((position, move))
-        return all_moves
-
-    def simulate_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> Dict[Tuple[int, int], Optional[Piece]]:
-        """Simulate a move and return the resulting board state."""
-        simulated_board = deepcopy(self.board)
-        simulated_board[to_pos] = simulated_board[from_pos]
-        simulated_board[from_pos] = None
-        return simulated_board
+
+        king_info = compute_king_info(
+            SQ[king_pos[0]][king_pos[1]],
+            self.occupancy[WHITE] | self.occupancy[BLACK],
+            self.occupancy[color],
+            bitboards[enemy + 'p'],
+            bitboards[enemy + 'n'],
+            bitboards[enemy + 'b'] | bitboards[enemy + 'q'],
+            bitboards[enemy + 'r'] | bitboards[enemy + 'q'],
+            PAWN_ATTACKS[color]
+        )
+        self._king_info[color] = king_info
+        return king_info
 
     def is_legal_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
         """Check if a move is legal (doesn't leave own king in check)."""
@@ -172,116 +310,142 @@ class Game:
         if not piece or piece.color != self.current_turn:
             return False
 
-        # Check if the move is in the piece's possible moves
-        possible_moves = piece.possible_moves(from_pos, self.board)
-        if to_pos not in possible_moves:
+        # Check if the move is in the piece's possible moves (stops at the first match)
+        if SQ[to_pos[0]][to_pos[1]] not in piece.possible_moves(SQ[from_pos[0]][from_pos[1]], self.board):
             return False
 
-        # Simulate the move to check if it leaves the king in check
-        original_board = self.board
-        self.board = self.simulate_move(from_pos, to_pos)
+        return self._keeps_king_safe(piece, from_pos, to_pos)
 
-        # Update king position temporarily if king is moving
-        original_king_pos = None
-        if isinstance(piece, King):
-            original_king_pos = self.get_king_position(piece.color)
-            self.update_king_position(piece.color, to_pos)
+    def _keeps_king_safe(self, piece: Piece, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
+        """Check that a pseudo-legal move doesn't leave the mover's king in check."""
+        if not isinstance(piece, King):
+            checkers, check_mask, pinned, pin_rays = self._get_king_info(piece.color)
+            to_bb = SQUARE_BB[SQ[to_pos[0]][to_pos[1]]]
 
-        # Check if king is in check after the move
-        in_check = self.is_in_check(piece.color)
+            if checkers:
+                # Only the king can escape a double check
+                if checkers & (checkers - 1):
+                    return False
+                # Otherwise the checker must be captured or the check blocked
+                if not to_bb & check_mask:
+                    return False
 
-        # Restore original state
-        self.board = original_board
-        if original_king_pos:
-            self.update_king_position(piece.color, original_king_pos)
+            # A pinned piece may only move along its pin ray
+            from_sq = SQ[from_pos[0]][from_pos[1]]
+            if pinned & SQUARE_BB[from_sq]:
+                return bool(pin_rays[from_sq] & to_bb)
+
+            return True
+
+        # King moves: test the target square on the bitboards, without playing the move
+        enemy = 'wb'[piece.color ^ 1]
+        bitboards = self.bitboards
+
+        return is_king_move_safe(
+            SQ[from_pos[0]][from_pos[1]],
+            SQ[to_pos[0]][to_pos[1]],
+            self.occupancy[WHITE] | self.occupancy[BLACK],
+            bitboards[enemy + 'p'],
+            bitboards[enemy + 'n'],
+            bitboards[enemy + 'b'] | bitboards[enemy + 'q'],
+            bitboards[enemy + 'r'] | bitboards[enemy + 'q'],
+            bitboards[enemy + 'k'],
+            PAWN_ATTACKS[piece.color]
+        )
+
+    def _is_legal_packed(self, move: int) -> bool:
+        """Check that a packed pseudo-legal move doesn't leave the mover's king in check."""
+        from_sq = move >> 10
+        return self._keeps_king_safe(self.board[from_sq], POSITIONS[from_sq], POSITIONS[(move >> 4) & 63])
+
+    def iter_legal_moves(self, color: int) -> Iterator[int]:
+        """
+        Yield the legal moves for the given color one at a time, so callers that
+        only need to know if a legal move exists can stop at the first one.
+        """
+        if self._legal_cache is not None and self._legal_cache[0] == (self.zobrist, color):
+            yield from self._legal_cache[1]
+            return
 
-        return not in_check
+        for move in self.iter_possible_moves(color):
+            if self._is_legal_packed(move):
+                yield move
 
-    def get_legal_moves(self, color: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """Get all legal moves for the given color."""
-        legal_moves = []
-        all_moves = self.get_all_possible_moves(color)
+    def get_legal_moves(self, color: int) -> List[int]:
+        """Get all legal moves for the given color, as packed moves (see unpack_move)."""
+        cache_key = (self.zobrist, color)
+        if self._legal_cache is not None and self._legal_cache[0] == cache_key:
+            return list(self._legal_cache[1])
 
-        for from_pos, to_pos in all_moves:
-            if self.is_legal_move(from_pos, to_pos):
-                legal_moves.append((from_pos, to_pos))
+        legal_moves = list(self.iter_legal_moves(color))
 
-        return legal_moves
+        self._legal_cache = (cache_key, legal_moves)
+        return list(legal_moves)
 
-    def is_checkmate(self, color: str) -> bool:
+    def is_checkmate(self, color: int) -> bool:
         """Check if the given color is in checkmate."""
-        if not self.is_in_check(color):
+        if not self._get_king_info(color)[0]:
             return False
-        return len(self.get_legal_moves(color)) == 0
+        return next(self.iter_legal_moves(color), None) is None
 
-    def is_stalemate(self, color: str) -> bool:
+    def is_stalemate(self, color: int) -> bool:
         """Check if the given color is in stalemate."""
-        if self.is_in_check(color):
+        if self._get_king_info(color)[0]:
             return False
-        return len(self.get_legal_moves(color)) == 0
+        return next(self.iter_legal_moves(color), None) is None
 
-    def can_castle(self, color: str, side: str) -> bool:
-        """Check if castling is possible for the given color and side."""
-        if self.is_in_check(color):
+    def can_castle(self, color: int, side: int) -> bool:
+        """
+        Check if castling is possible for the given color and side.
+
+        The checks go from the cheapest to the most expensive one, so most
+        refusals never reach an attack test.
+        """
+        index = color * 2 + side
+        if not self.castling_rights[index]:
             return False
 
-        castling_key = f"{color}_{side}"
-        if not self.castling_rights.get(castling_key, False):
+        # Squares between king and rook must be empty
+        if (self.occupancy[WHITE] | self.occupancy[BLACK]) & _CASTLE_EMPTY_MASKS[index]:
             return False
 
-        king_pos = self.get_king_position(color)
-        row = king_pos[0]
+        # The king may not castle out of check (checkers come from the cached king info)
+        if self._get_king_info(color)[0]:
+            return False
 
-        if side == 'kingside':
-            # Check if squares between king and rook are empty
-            for col in range(5, 7):
-                if not self.is_square_empty((row, col)):
-                    return False
-                # Check if squares king passes through are under attack
-                if self.is_square_under_attack((row, col), 'black' if color == 'white' else 'white'):
-                    return False
-        else:  # queenside
-            # Check if squares between king and rook are empty
-            for col in range(1, 4):
-                if not self.is_square_empty((row, col)):
-                    return False
-            # Check if squares king passes through are under attack
-            for col in range(2, 4):
-                if self.is_square_under_attack((row, col), 'black' if color == 'white' else 'white'):
-                    return False
+        # Nor through or into an attacked square
+        for position in _CASTLE_SAFE_SQUARES[index]:
+            if self.is_square_under_attack(position, color ^ 1):
+                return False
 
         return True
 
-    def execute_castling(self, color: str, side: str) -> None:
+    def execute_castling(self, color: int, side: int) -> None:
         """Execute castling move."""
-        row = 0 if color == 'black' else 7
+        row = 0 if color == BLACK else 7
 
-        if side == 'kingside':
+        if side == KINGSIDE:
             # Move king
-            self.board[(row, 6)] = self.board[(row, 4)]
-            self.board[(row, 4)] = None
+            self._set_square((row, 6), self.board[SQ[row][4]])
+            self._set_square((row, 4), None)
             self.update_king_position(color, (row, 6))
 
             # Move rook
-            self.board[(row, 5)] = self.board[(row, 7)]
-            self.board[(row, 7)] = None
+            self._set_square((row, 5), self.board[SQ[row][7]])
+            self._set_square((row, 7), None)
         else:  # queenside
             # Move king
-            self.board[(row, 2)] = self.board[(row, 4)]
-            self.board[(row, 4)] = None
+            self._set_square((row, 2), self.board[SQ[row][4]])
+            self._set_square((row, 4), None)
             self.update_king_position(color, (row, 2))
 
             # Move rook
-            self.board[(row, 3)] = self.board[(row, 0)]
-            self.board[(row, 0)] = None
+            self._set_square((row, 3), self.board[SQ[row][0]])
+            self._set_square((row, 0), None)
 
         # Update castling rights
-        self.castling_rights[f"{color}_kingside"] = False
-        self.castling_rights[f"{color}_queenside"] = False
-
-    def is_piece(self, position: tuple) -> bool:
-        """ This method will check if a square is empty or not"""
-        return False if self.board[position] is None else True
+        self.castling_rights[color * 2 + KINGSIDE] = False
+        self.castling_rights[color * 2 + QUEENSIDE] = False
 
     def is_promotion(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
         """Check if a move results in pawn promotion."""
@@ -289,13 +453,13 @@ class Game:
         if not isinstance(piece, Pawn):
             return False
 
-        target_row = 0 if piece.color == 'white' else 7
+        target_row = 0 if piece.color == WHITE else 7
         return to_pos[0] == target_row
 
     def promote_pawn(self, position: Tuple[int, int], piece_type: str = 'queen') -> None:
         """Promote a pawn to the specified piece type."""
         color = self.get_piece(position).color
-        self.board[position] = create_piece(piece_type, color)
+        self._set_square(position, create_piece(piece_type, color))
 
     def make_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int], promotion_piece: str = 'queen') -> bool:
         """
@@ -306,10 +470,18 @@ class Game:
         :param promotion_piece: Piece to promote pawn to (if applicable)
         :return: True if move was successful, False otherwise
         """
-        if not self.is_legal_move(from_pos, to_pos):
+        piece = self.get_piece(from_pos)
+        if not piece or piece.color != self.current_turn:
+            return False
+
+        flags = self._move_flags(piece, from_pos, to_pos)
+        if flags & MOVE_CASTLING:
+            side = KINGSIDE if to_pos[1] > from_pos[1] else QUEENSIDE
+            if not self.can_castle(piece.color, side):
+                return False
+        elif not self.is_legal_move(from_pos, to_pos):
             return False
 
-        piece = self.get_piece(from_pos)
         captured_piece = self.get_piece(to_pos)
 
         # Create move object
@@ -317,51 +489,42 @@ class Game:
             from_pos=from_pos,
             to_pos=to_pos,
             piece=piece,
-            captured_piece=captured_piece
+            captured_piece=captured_piece,
+            prev_castling_rights=list(self.castling_rights),
+            prev_halfmove_clock=self.halfmove_clock
         )
 
         # Handle special moves
-        if isinstance(piece, King) and abs(to_pos[1] - from_pos[1]) == 2:
-            # Castling
-            side = 'kingside' if to_pos[1] > from_pos[1] else 'queenside'
-            if self.can_castle(piece.color, side):
-                self.execute_castling(piece.color, side)
-                move.is_castling = True
-            else:
-                return False
+        if flags & MOVE_CASTLING:
+            self.execute_castling(piece.color, side)
+            move.is_castling = True
         else:
             # Regular move
-            self.board[to_pos] = piece
-            self.board[from_pos] = None
+            self._set_square(to_pos, piece)
+            self._set_square(from_pos, None)
 
             # Update king position if king moved
             if isinstance(piece, King):
                 self.update_king_position(piece.color, to_pos)
 
         # Handle pawn promotion
-        if self.is_promotion(from_pos, to_pos):
+        if flags & MOVE_PROMOTION:
             self.promote_pawn(to_pos, promotion_piece)
             move.is_promotion = True
             move.promoted_to = promotion_piece
 
-        # Update castling rights if rook or king moved
+        # Update castling rights if king moved, or a rook left or was captured on its corner
         if isinstance(piece, King):
-            self.castling_rights[f"{piece.color}_kingside"] = False
-            self.castling_rights[f"{piece.color}_queenside"] = False
-        elif isinstance(piece, Rook):
-            row = from_pos[0]
-            col = from_pos[1]
-            if (row, col) == (0, 0):
-                self.castling_rights['black_queenside'] = False
-            elif (row, col) == (0, 7):
-                self.castling_rights['black_kingside'] = False
-            elif (row, col) == (7, 0):
-                self.castling_rights['white_queenside'] = False
-            elif (row, col) == (7, 7):
-                self.castling_rights['white_kingside'] = False
-
-        # Mark piece as moved
-        piece.has_moved = True
+            self.castling_rights[piece.color * 2 + KINGSIDE] = False
+            self.castling_rights[piece.color * 2 + QUEENSIDE] = False
+        for corner in (from_pos, to_pos):
+            right = _ROOK_SQ_TO_RIGHT.get(corner)
+            if right is not None:
+                self.castling_rights[right] = False
+
+        # Mark piece as moved by swapping in its moved flyweight
+        if not piece.has_moved and not move.is_promotion:
+            self._set_square(to_pos, piece_instance(type(piece), piece.color, True))
 
         # Update move counters
         if isinstance(piece, Pawn) or captured_piece:
@@ -369,27 +532,43 @@ class Game:
         else:
             self.halfmove_clock += 1
 
-        if self.current_turn == 'black':
+        if self.current_turn == BLACK:
             self.fullmove_number += 1
 
         # Add move to history
         self.move_history.append(move)
 
         # Switch turns
-        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+        self.current_turn ^= 1
 
         # Update game state
         self.update_game_state()
 
         return True
 
+    def _move_flags(self, piece: Piece, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> int:
+        """Classify a move given as positions into its packed move flags."""
+        flags = MOVE_CAPTURE if self.is_enemy_piece(to_pos, piece.color) else 0
+        # Only the king going from its home square two columns along its home row castles
+        home_row = 7 if piece.color == WHITE else 0
+        if (isinstance(piece, King) and from_pos == (home_row, 4) and
+                (to_pos == (home_row, 6) or to_pos == (home_row, 2))):
+            flags |= MOVE_CASTLING
+        elif isinstance(piece, Pawn) and to_pos[0] == (0 if piece.color == WHITE else 7):
+            flags |= MOVE_PROMOTION
+        return flags
+
     def update_game_state(self) -> None:
         """Update the current game state based on the board position."""
-        if self.is_checkmate(self.current_turn):
-            self.game_state = GameState.CHECKMATE
-        elif self.is_stalemate(self.current_turn):
-            self.game_state = GameState.STALEMATE
-        elif self.is_in_check(self.current_turn):
+        # The king info is needed by the legality checks below anyway, so read the checkers from it
+        in_check = bool(self._get_king_info(self.current_turn)[0])
+
+        # Stop at the first legal move found, one is enough to rule out mate and stalemate
+        has_legal_move = next(self.iter_legal_moves(self.current_turn), None) is not None
+
+        if not has_legal_move:
+            self.game_state = GameState.CHECKMATE if in_check else GameState.STALEMATE
+        elif in_check:
             self.game_state = GameState.CHECK
         elif self.halfmove_clock >= 100:  # 50-move rule
             self.game_state = GameState.DRAW
@@ -404,34 +583,34 @@ class Game:
         last_move = self.move_history.pop()
 
         # Restore the piece to its original position
-        self.board[last_move.from_pos] = last_move.piece
+        self._set_square(last_move.from_pos, last_move.piece)
 
         # Restore captured piece or clear destination
-        self.board[last_move.to_pos] = last_move.captured_piece
+        self._set_square(last_move.to_pos, last_move.captured_piece)
 
         # Handle special move undos
         if last_move.is_castling:
             # Undo castling - restore rook position
             row = last_move.from_pos[0]
             if last_move.to_pos[1] == 6:  # Kingside
-                self.board[(row, 7)] = self.board[(row, 5)]
-                self.board[(row, 5)] = None
+                self._set_square((row, 7), self.board[SQ[row][5]])
+                self._set_square((row, 5), None)
             else:  # Queenside
-                self.board[(row, 0)] = self.board[(row, 3)]
-                self.board[(row, 3)] = None
+                self._set_square((row, 0), self.board[SQ[row][3]])
+                self._set_square((row, 3), None)
 
         # Update king position if king was moved
         if isinstance(last_move.piece, King):
             self.update_king_position(last_move.piece.color, last_move.from_pos)
 
-        # Mark piece as not moved if it was the first move
-        if len(self.move_history) == 0 or not any(
-            move.piece == last_move.piece for move in self.move_history
-        ):
-            last_move.piece.has_moved = False
+        # Restore the castling rights and 50-move counter the move overwrote
+        self.castling_rights = last_move.prev_castling_rights
+        self.halfmove_clock = last_move.prev_halfmove_clock
+        if self.current_turn == WHITE:
+            self.fullmove_number -= 1
 
         # Switch turns back
-        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+        self.current_turn ^= 1
 
         # Update game state
         self.update_game_state()
@@ -440,20 +619,21 @@ class Game:
 
     def new_game(self) -> None:
         """Start a new game by resetting all game state."""
-        self.current_turn = 'white'
+        self.current_turn = WHITE
         self.move_history = []
         self.board = self.create_board()
         self.game_state = GameState.ACTIVE
 
+        self.bitboards = dict(START_BITBOARDS)
+        self.occupancy = [START_WHITE, START_BLACK]
+        self.zobrist = _STARTING_ZOBRIST
+        self._king_info = {}
+        self._legal_cache = None
+
         self.white_king_pos = (7, 4)
         self.black_king_pos = (0, 4)
 
-        self.castling_rights = {
-            'white_kingside': True,
-            'white_queenside': True,
-            'black_kingside': True,
-            'black_queenside': True
-        }
+        self.castling_rights = [True, True, True, True]
 
         self.en_passant_target = None
         self.halfmove_clock = 0
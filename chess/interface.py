@@ -18,19 +18,44 @@ from .const import *
 from .game import *
 from .updater import Updater
 from .sound import SoundEngine
-from engine.deepcore import DeepCore
 from .utils import Settings, PgnFile, ChessFile
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFrame, QMenuBar, QAction, QFileDialog, QMessageBox, QDialog,
-    QCheckBox, QComboBox, QSlider, QGroupBox, QFormLayout, QSpinBox,
-    QColorDialog, QButtonGroup, QRadioButton, QTabWidget, QApplication
+    QFrame, QMenuBar, QAction, QFileDialog, QMessageBox, QApplication
 )
 
-from PyQt5.QtCore import Qt, QUrl, pyqtSignal, QRect, QTimer, QPoint
-from PyQt5.QtGui import QIcon, QFont, QDesktopServices, QPixmap, QPainter, QPen, QBrush, QKeyEvent
-from typing import Tuple, Optional, List
+from PyQt5.QtCore import Qt, QUrl, QRect, QTimer, QPoint
+from PyQt5.QtGui import QIcon, QFont, QDesktopServices, QPixmap, QPainter, QPen, QBrush, QKeyEvent, QColor
+from typing import Tuple, Optional, List, FrozenSet
+from time import perf_counter
+
+# DEFINE THE THEME COLORS (from the RGBA tuples in 'const.py')
+DARK_SQUARE: QColor = QColor(*DARK_SQUARE_RGBA)
+LIGHT_SQUARE: QColor = QColor(*LIGHT_SQUARE_RGBA)
+HIGHLIGHT_COLOR: QColor = QColor(*HIGHLIGHT_COLOR_RGBA)
+MOVE_COLOR: QColor = QColor(*MOVE_COLOR_RGBA)
+BACKGROUND_COLOR: QColor = QColor(*BACKGROUND_COLOR_RGBA)
+PANEL_COLOR: QColor = QColor(*PANEL_COLOR_RGBA)
+
+# DEFINE PER-SQUARE GEOMETRY TABLES (pixel positions never change, so compute them once)
+BOARD_PIXELS: int = BOARD_SIZE * SQSize
+SQUARE_X: tuple = tuple(OFFSET_X + col * SQSize for col in range(BOARD_SIZE))
+SQUARE_Y: tuple = tuple(OFFSET_Y + row * SQSize for row in range(BOARD_SIZE))
+SQUARE_RECTS: tuple = tuple(
+    tuple(QRect(SQUARE_X[col], SQUARE_Y[row], SQSize, SQSize) for col in range(BOARD_SIZE)) for row in range(BOARD_SIZE)
+)
+MOVE_DOT_RECTS: tuple = tuple(
+    tuple(QRect(SQUARE_X[col] + SQSize // 2 - SQSize // 8, SQUARE_Y[row] + SQSize // 2 - SQSize // 8, SQSize // 4, SQSize // 4)
+          for col in range(BOARD_SIZE)) for row in range(BOARD_SIZE)
+)
+# Color of every square, indexed by row * 8 + col
+COLOR_TABLE: tuple = tuple(
+    DARK_SQUARE if (row + col) & 1 == 0 else LIGHT_SQUARE for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+)
+# Turn label text and style, indexed by color
+TURN_TEXT: tuple = tuple(f"{name.capitalize()}'s turn" for name in COLOR_NAMES)
+TURN_STYLE: tuple = tuple(f"color: {name};" for name in COLOR_NAMES)
 
 
 class Chess(QWidget):
@@ -44,7 +69,7 @@ class Chess(QWidget):
         game (Game): Handles chess logic and state.
         sound (SoundEngine): Plays sound effects for moves and events.
         selected_piece (tuple | None): The currently selected piece (row, col), or None.
-        possible_moves (list): List of legal moves for the selected piece.
+        possible_moves (frozenset): Legal target squares of the selected piece.
     """
 
     def __init__(self, parent=None) -> None:
@@ -60,133 +85,193 @@ class Chess(QWidget):
         self.sound = SoundEngine()
 
         self.selected_piece: tuple | None = None
-        self.possible_moves: list = []
+        self.possible_moves: frozenset = frozenset()
+        self.check_position: tuple | None = None
+
+        # Legal moves of the side to move, indexed by starting square
+        self._legal_cache: dict[tuple[int, int], frozenset] = {}
+        self._rebuild_legal_cache()
+
+        # Game over dialog, built on the first game over
+        self._game_over_box: QMessageBox | None = None
+
+        # Static board (border, squares and coordinates), rendered on first paint
+        self._board_bg: QPixmap | None = None
+        # Device pixel ratio the cached pixmaps were rendered at
+        self._pixmap_ratio: float = 0.0
+        # One pre-rendered glyph per piece key ('wp', 'bk', ...), rendered on first paint
+        self._piece_pixmaps: dict[str, QPixmap] = {}
+
+        # Painting resources, built once instead of on every repaint
+        self._piece_font: QFont = QFont('Arial', SQSize // 2, QFont.Bold)
+        self._coord_font: QFont = QFont('Arial', 10)
+        self._coord_pen: QPen = QPen(QColor(180, 180, 180))
+        self._white_pen: QPen = QPen(QColor(255, 255, 255))
+        self._black_pen: QPen = QPen(QColor(0, 0, 0))
+        self._move_brush: QBrush = QBrush(MOVE_COLOR)
+        self._move_pen: QPen = QPen(MOVE_COLOR, 3)
+        self._check_pen: QPen = QPen(Qt.red, 3)
+        self._check_brush: QBrush = QBrush(QColor(255, 0, 0, 100))
+        self._border_pen: QPen = QPen(QColor(30, 30, 30), 2)
+        self._border_brush: QBrush = QBrush(QColor(40, 40, 40))
+        self._board_rect: QRect = QRect(OFFSET_X - 5, OFFSET_Y - 5, SQSize * 8 + 10, SQSize * 8 + 10)
 
     def paintEvent(self, event) -> None:
         """ This method will handle paintEvent to draw stuff"""
 
+        # Render the caches at the screen's pixel ratio (sharp on HiDPI screens),
+        # and again when the window moves to a screen with another ratio
+        ratio = self.devicePixelRatioF()
+        if ratio != self._pixmap_ratio:
+            self._pixmap_ratio = ratio
+            self._board_bg = self._render_board_background(ratio)
+            self._piece_pixmaps = self._render_piece_pixmaps(ratio)
+
         self.q_painter.begin(self)
-        self.q_painter.setRenderHint(QPainter.Antialiasing)
 
-        # Draw a border around the board
-        board_rect: int = QRect(OFFSET_X - 5, OFFSET_Y - 5, SQSize * 8 + 10, SQSize * 8 + 10)
+        # Blit the static board, then draw the selection, possible moves and pieces over it
+        self.q_painter.drawPixmap(0, 0, self._board_bg)
 
-        self.q_painter.setPen(QPen(QColor(30, 30, 30), 2))
-        self.q_painter.setBrush(QBrush(QColor(40, 40, 40)))
-        self.q_painter.drawRect(board_rect)
+        # Fast path for the common repaint: nothing selected and no check, so only pieces
+        if self.selected_piece is None and not self.possible_moves and self.check_position is None:
+            self.draw_pieces()
+            self.q_painter.end()
+            return
 
-        # Draw the board and pieces
+        self.q_painter.setRenderHint(QPainter.Antialiasing)
         self.draw_board()
-        self.draw_coordinates()
         self.draw_pieces()
 
         # Highlight king checks
-        if hasattr(self, 'check_position') and self.check_position:
-            painter = QPainter(self)
+        if self.check_position is not None:
             row, col = self.check_position
 
-            square_size = self.width() // 8
-            x = col * square_size
-            y = row * square_size
-
             # Draw red rectangle
-            painter.setPen(QPen(Qt.red, 3))
-            painter.setBrush(QBrush(QColor(255, 0, 0, 100)))
-            painter.drawRect(x, y, square_size, square_size)
+            self.q_painter.setPen(self._check_pen)
+            self.q_painter.setBrush(self._check_brush)
+            self.q_painter.drawRect(SQUARE_RECTS[row][col])
 
         self.q_painter.end()
 
-    def draw_board(self) -> None:
-        """ This method will draw the chess board with enhanced visuals"""
+    def _render_board_background(self, ratio: float) -> QPixmap:
+        """ This method will render the parts of the board that never change into a pixmap"""
+
+        pixmap = QPixmap(round(WIDTH * ratio), round(HEIGHT * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(BACKGROUND_COLOR)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        # Drawing the board
+        # Draw a border around the board
+        painter.setPen(self._border_pen)
+        painter.setBrush(self._border_brush)
+        painter.drawRect(self._board_rect)
+
+        # Draw the squares - using professional chess colors
         for row in range(BOARD_SIZE):
             for col in range(BOARD_SIZE):
+                painter.fillRect(SQUARE_RECTS[row][col], COLOR_TABLE[(row << 3) | col])
+
+        self.draw_coordinates(painter)
+        painter.end()
+
+        return pixmap
 
-                x: int = (row + col) % 2
-                # Set Color - using professional chess colors
-                color = DARK_SQUARE if x == 0 else LIGHT_SQUARE
-
-                # For selected piece coloring
-                if (row, col) == self.selected_piece:
-                    color = HIGHLIGHT_COLOR
-
-                # For possible moves coloring
-                if self.possible_moves is not None and (row, col) in self.possible_moves:
-                    # Draw different indicators for empty squares vs. captures
-                    rect = QRect(OFFSET_X + col * SQSize, OFFSET_Y + row * SQSize, SQSize, SQSize)
-                    self.q_painter.fillRect(rect, color)
-
-                    if not self.game.is_piece((row, col)):
-                        # Empty square - draw a dot
-                        self.q_painter.setPen(Qt.NoPen)
-                        self.q_painter.setBrush(QBrush(MOVE_COLOR))
-                        center_x = OFFSET_X + col * SQSize + SQSize // 2
-                        center_y = OFFSET_Y + row * SQSize + SQSize // 2
-                        self.q_painter.drawEllipse(center_x - SQSize // 8, center_y - SQSize // 8, SQSize // 4, SQSize // 4)
-                        continue
-                    else:
-                        # Capture - draw a highlighted border
-                        self.q_painter.setPen(QPen(MOVE_COLOR, 3))
-                        self.q_painter.setBrush(Qt.NoBrush)
-                        self.q_painter.drawRect(rect)
-                        continue
-
-                # Draw Board
-                self.q_painter.fillRect(OFFSET_X + col * SQSize, OFFSET_Y + row * SQSize, SQSize, SQSize, color)
-
-    def draw_coordinates(self) -> None:
+    def _render_piece_pixmaps(self, ratio: float) -> dict[str, QPixmap]:
+        """ This method will render every piece glyph once into a square sized pixmap"""
+
+        pixmaps = {}
+        for color, pen in ((WHITE, self._white_pen), (BLACK, self._black_pen)):
+            for piece_type in ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king'):
+                piece = create_piece(piece_type, color)
+
+                pixmap = QPixmap(round(SQSize * ratio), round(SQSize * ratio))
+                pixmap.setDevicePixelRatio(ratio)
+                pixmap.fill(Qt.transparent)
+
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.Antialiasing)
+                painter.setPen(pen)
+                painter.setFont(self._piece_font)
+                painter.drawText(SQSize // 4, 3 * SQSize // 4, piece.texture)
+                painter.end()
+
+                pixmaps[piece.key] = pixmap
+
+        return pixmaps
+
+    def draw_board(self) -> None:
+        """
+        This method will draw the selected square and the possible moves over the board.
+        It paints with the active 'q_painter', so only call it from 'paintEvent'
+        (use 'self.update()' to request a repaint).
+        """
+
+        # For selected piece coloring
+        if self.selected_piece is not None:
+            row, col = self.selected_piece
+            self.q_painter.fillRect(SQUARE_RECTS[row][col], HIGHLIGHT_COLOR)
+
+        # For possible moves coloring
+        for row, col in self.possible_moves:
+            # Draw different indicators for empty squares vs. captures
+            if self.game.is_square_empty((row, col)):
+                # Empty square - draw a dot
+                self.q_painter.setPen(Qt.NoPen)
+                self.q_painter.setBrush(self._move_brush)
+                self.q_painter.drawEllipse(MOVE_DOT_RECTS[row][col])
+            else:
+                # Capture - draw a highlighted border
+                self.q_painter.setPen(self._move_pen)
+                self.q_painter.setBrush(Qt.NoBrush)
+                self.q_painter.drawRect(SQUARE_RECTS[row][col])
+
+    def draw_coordinates(self, painter: QPainter) -> None:
         """Draw board coordinates (a-h, 1-8)"""
-        self.q_painter.setPen(QColor(180, 180, 180))
-        self.q_painter.setFont(QFont('Arial', 10))
+        painter.setPen(self._coord_pen)
+        painter.setFont(self._coord_font)
 
         # Draw column coordinates (a-h)
         for col in range(BOARD_SIZE):
-            x = OFFSET_X + col * SQSize + SQSize - 14
+            x = SQUARE_X[col] + SQSize - 14
             y = OFFSET_Y + 8 * SQSize + 20
-            self.q_painter.drawText(x, y, chr(97 + col))
+            painter.drawText(x, y, chr(97 + col))
 
         # Draw row coordinates (1-8)
         for row in range(BOARD_SIZE):
             x = OFFSET_X - 14
-            y = OFFSET_Y + row * SQSize + 20
-            self.q_painter.drawText(x, y, str(8 - row))
+            y = SQUARE_Y[row] + 20
+            painter.drawText(x, y, str(8 - row))
 
     def draw_pieces(self) -> None:
         """ This method will draw pieces on the board with enhanced styling"""
 
-        # Drawing the pieces
-        for pos, piece in self.game.board.items():
-            row, col = pos
-            x = OFFSET_X + col * SQSize + SQSize // 4
-            y = OFFSET_Y + row * SQSize + 3 * SQSize // 4
-            if piece is not None:
-                # Set color based on piece color
-                if piece.color == 'white':
-                    self.q_painter.setPen(QColor(255, 255, 255))
-                else:
-                    self.q_painter.setPen(QColor(0, 0, 0))
-
-                # Draw the piece with better font
-                self.q_painter.setFont(QFont('Arial', SQSize // 2, QFont.Bold))
-                self.q_painter.drawText(x, y, piece.texture)
+        # Drawing the pieces, blitting their pre-rendered glyphs
+        draw_pixmap = self.q_painter.drawPixmap
+        pixmaps = self._piece_pixmaps
+
+        for color in (WHITE, BLACK):
+            for (row, col), piece in self.game.iter_pieces(color):
+                draw_pixmap(SQUARE_X[col], SQUARE_Y[row], pixmaps[piece.key])
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press events for piece selection and movement."""
 
-        x: int = event.x()
-        y: int = event.y()
-
-        # Determine the clicked square
-        col: int = (x - OFFSET_X) // SQSize
-        row: int = (y - OFFSET_Y) // SQSize
+        # Pixel coordinates relative to the board corner
+        x: int = event.x() - OFFSET_X
+        y: int = event.y() - OFFSET_Y
 
-        # Check if the mouse press is inside the board
-        if not (0 <= col < BOARD_SIZE and 0 <= row < BOARD_SIZE):
+        # Check if the mouse press is inside the board before dividing
+        if not (0 <= x < BOARD_PIXELS and 0 <= y < BOARD_PIXELS):
             self.clear_selection()
             self.update()
             return
 
+        # Determine the clicked square
+        col: int = x // SQSize
+        row: int = y // SQSize
+
         clicked_position = (row, col)
         clicked_piece = self.game.get_piece(clicked_position)
 
@@ -209,7 +294,6 @@ class Chess(QWidget):
             if legal_moves:  # Only select if a piece has legal moves
                 self.selected_piece = position
                 self.possible_moves = legal_moves
-                self.draw_board()
             else:
                 # The Piece has no legal moves, show feedback
                 self._show_no_moves_feedback(position)
@@ -230,7 +314,6 @@ class Chess(QWidget):
             if legal_moves:
                 self.selected_piece = position
                 self.possible_moves = legal_moves
-                self.draw_board()
             else:
                 self._show_no_moves_feedback(position)
             return
@@ -243,36 +326,36 @@ class Chess(QWidget):
             self.clear_selection()
             # self._show_invalid_move_feedback(position)
 
-    def _get_legal_moves_for_piece(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+    def _get_legal_moves_for_piece(self, position: Tuple[int, int]) -> FrozenSet[Tuple[int, int]]:
         """Get all legal moves for a piece at the given position."""
-        piece = self.game.get_piece(position)
-        if not piece:
-            return []
+        return self._legal_cache.get(position, frozenset())
 
-        # Get possible moves from the piece
-        possible_moves = piece.possible_moves(position, self.game.board)
+    def _rebuild_legal_cache(self) -> None:
+        """Compute the legal moves of the side to move once per turn, indexed by starting square."""
+        color = self.game.current_turn
+        legal_cache: dict = {}
 
-        # Filter to only include legal moves (don't leave king in check)
-        legal_moves: list = []
-        for move in possible_moves:
-            if self.game.is_legal_move(position, move):
-                legal_moves.append(move)
+        for move in self.game.get_legal_moves(color):
+            from_pos, to_pos, _ = unpack_move(move)
+            legal_cache.setdefault(from_pos, []).append(to_pos)
 
         # Add castling moves for king
-        if isinstance(piece, King):
-            legal_moves.extend(self._get_castling_moves(piece.color))
+        castling_moves = self._get_castling_moves(color)
+        if castling_moves:
+            legal_cache.setdefault(self.game.get_king_position(color), []).extend(castling_moves)
 
-        return legal_moves
+        # Frozen sets, so 'position in self.possible_moves' is a hash lookup
+        self._legal_cache = {position: frozenset(moves) for position, moves in legal_cache.items()}
 
-    def _get_castling_moves(self, color: str) -> List[Tuple[int, int]]:
+    def _get_castling_moves(self, color: int) -> List[Tuple[int, int]]:
         """Get available castling moves for the given color."""
         castling_moves = []
-        row = 0 if color == 'black' else 7
+        row = 0 if color == BLACK else 7
 
-        if self.game.can_castle(color, 'kingside'):
+        if self.game.can_castle(color, KINGSIDE):
             castling_moves.append((row, 6))
 
-        if self.game.can_castle(color, 'queenside'):
+        if self.game.can_castle(color, QUEENSIDE):
             castling_moves.append((row, 2))
 
         return castling_moves
@@ -290,8 +373,12 @@ class Chess(QWidget):
         move_successful = self.game.make_move(from_pos, to_pos, promotion_piece)
 
         if move_successful:
+            self._rebuild_legal_cache()
+            # The previous check is over, '_handle_game_state_change' sets a new one if any
+            self.check_position = None
+
             # Play move sound
-            if hasattr(self, 'sound'):
+            if self.sound:
                 self._play_move_sound(from_pos, to_pos)
 
             # Clear selection
@@ -299,9 +386,6 @@ class Chess(QWidget):
 
             # Check game state and show appropriate feedback
             self._handle_game_state_change()
-
-            # Update board display
-            self.draw_board()
         else:
             # Move failed, clear selection and show error
             self.clear_selection()
@@ -339,7 +423,7 @@ class Chess(QWidget):
     def _handle_game_state_change(self) -> None:
         """Handle changes in game state (check, checkmate, etc.)."""
         if self.game.game_state == GameState.CHECKMATE:
-            winner = 'Black' if self.game.current_turn == 'white' else 'White'
+            winner = 'Black' if self.game.current_turn == WHITE else 'White'
             self._show_game_over_message(f"Checkmate! {winner} wins!")
         elif self.game.game_state == GameState.STALEMATE:
             self._show_game_over_message("Stalemate! The game is a draw.")
@@ -351,7 +435,7 @@ class Chess(QWidget):
     def clear_selection(self) -> None:
         """Clear the current piece selection and possible moves."""
         self.selected_piece = None
-        self.possible_moves = []
+        self.possible_moves = frozenset()
 
     def _show_no_moves_feedback(self, position: Tuple[int, int]) -> None:
         """Show feedback when a piece has no legal moves."""
@@ -361,9 +445,13 @@ class Chess(QWidget):
 
     def _show_game_over_message(self, status: str, show_restart: bool = True) -> bool:
         """Show a sleek, modern game-over dialog with glassmorphism styling."""
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Game Over")
-        msg_box.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
+        # Build and style the dialog once, later games only change its text and buttons
+        if self._game_over_box is None:
+            self._game_over_box = QMessageBox(self)
+            self._game_over_box.setWindowTitle("Game Over")
+            self._game_over_box.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
+            self._game_over_box.setStyleSheet(GAME_OVER_STYLE)
+        msg_box = self._game_over_box
 
         # Create custom content with iOS-style typography
         content = f"""
@@ -384,71 +472,6 @@ class Chess(QWidget):
             msg_box.setStandardButtons(QMessageBox.Ok)
             msg_box.setDefaultButton(QMessageBox.Ok)
 
-        # iOS-style clean white/gray styling
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: rgba(255, 255, 255, 0.95);
-                border: none;
-                border-radius: 14px;
-                min-width: 280px;
-                max-width: 320px;
-                min-height: 140px;
-            }
-
-            QMessageBox QLabel {
-                background: transparent;
-                color: #1c1c1e;
-                border: none;
-                padding: 20px 16px 16px 16px;
-            }
-
-            QPushButton {
-                background-color: transparent;
-                color: #007aff;
-                border: none;
-                border-top: 0.5px solid rgba(60, 60, 67, 0.29);
-                border-radius: 0px;
-                padding: 16px 12px;
-                font-size: 17px;
-                font-weight: 400;
-                min-height: 44px;
-            }
-
-            QPushButton:hover {
-                background-color: rgba(0, 122, 255, 0.05);
-            }
-
-            QPushButton:pressed {
-                background-color: rgba(0, 122, 255, 0.1);
-            }
-
-            QPushButton:default {
-                color: #007aff;
-                font-weight: 600;
-            }
-
-            QPushButton:default:hover {
-                background-color: rgba(0, 122, 255, 0.05);
-            }
-
-            QPushButton:default:pressed {
-                background-color: rgba(0, 122, 255, 0.1);
-            }
-
-            QPushButton:first-child {
-                border-bottom-left-radius: 14px;
-            }
-
-            QPushButton:last-child {
-                border-bottom-right-radius: 14px;
-            }
-
-            QPushButton:only-child {
-                border-bottom-left-radius: 14px;
-                border-bottom-right-radius: 14px;
-            }
-        """)
-
         # Center the dialog on screen
         msg_box.move(
             self.geometry().center() - msg_box.rect().center()
@@ -457,20 +480,19 @@ class Chess(QWidget):
         result = msg_box.exec_()
         return result == QMessageBox.Yes if show_restart else False
 
-    def _check_highlight(self, player: str) -> None:
-        """ This method will color the king in check"""
-
-        king_pos: tuple = self.game.get_king_position(player)
-
-        print(king_pos)
+    def _check_highlight(self, player: int) -> None:
+        """ This method will color the king in check, it is drawn by the next paintEvent"""
+        self.check_position = self.game.get_king_position(player)
 
     def reset_game(self) -> None:
         """Reset the game to initial state"""
 
         # Clear all variables
-        self.selected_piece, self.possible_moves = None, []
+        self.selected_piece, self.possible_moves = None, frozenset()
+        self.check_position = None
         # Create a new board
         self.game.new_game()
+        self._rebuild_legal_cache()
         # Update the game
         self.update()
 
@@ -478,7 +500,12 @@ class Chess(QWidget):
         """Undo the last move"""
 
         # get Undo move
-        self.game.undo_move()
+        if self.game.undo_move():
+            self._rebuild_legal_cache()
+            # Highlight the king again if the restored position is a check
+            self.check_position = None
+            if self.game.game_state == GameState.CHECK:
+                self._check_highlight(self.game.current_turn)
         # Update the board
         self.update()
 
@@ -520,7 +547,7 @@ class MainWindow(QMainWindow):
 
         self.setWindowTitle(f"DeepCore Chess - v{VERSION}")
         self.setGeometry(100, 100, WIDTH + 300, HEIGHT + 100)
-        self.setWindowIcon(QIcon(str(APP_ICON)))
+        self.setWindowIcon(QIcon(APP_ICON))
         self.setMinimumSize(800, 600)
 
         # Initialize central widget
@@ -532,7 +559,13 @@ class MainWindow(QMainWindow):
 
         # Initialize Widgets
         self.settings_widget = SettingsWidget(self)
-        self.update_widget: UpdateWidget | None = UpdateWidget() if updater.is_new_update() else None
+        # The update check runs in the background, '_update' shows the widget once it answers
+        self.update_widget: UpdateWidget | None = None
+        self._update_check = updater.check_in_background()
+        # Dialogs built on first open
+        self.about_box: QMessageBox | None = None
+        self._about_donate_button: QPushButton | None = None
+        self.shortcuts_msg: QMessageBox | None = None
 
         # Main layout with improved spacing
         main_layout = QHBoxLayout(central_widget)
@@ -549,7 +582,9 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.chess_board, 3)  # Give more space to board
         main_layout.addWidget(self.right_panel, 1)
 
-        # Set time to call '_update' method every 50 ms
+        # Set time to call '_update' method every 50 ms, it only touches the turn label
+        # when the turn it last saw has changed
+        self._last_turn: Optional[int] = None
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self._update)
         self.update_timer.start(50)
@@ -563,8 +598,8 @@ class MainWindow(QMainWindow):
         """Handle key press events."""
         if event.key() == Qt.Key_Escape:
 
-            for widget in [self.settings_widget, self.about_box, self.shortcuts_msg]:
-                if widget.isVisible():
+            for widget in (self.settings_widget, self.about_box, self.shortcuts_msg):
+                if widget is not None and widget.isVisible():
                     widget.hide()
 
         elif event.key() == Qt.Key_Left:
@@ -574,7 +609,7 @@ class MainWindow(QMainWindow):
             self.chess_board.redo_move()
 
     def _apply_theme(self):
-        """Apply the current theme styling."""
+        """Apply the current theme styling, menu bar included, with a single stylesheet."""
         self.setStyleSheet(f"""
             QMainWindow {{
                 background-color: {BACKGROUND_COLOR.name()};
@@ -616,6 +651,41 @@ class MainWindow(QMainWindow):
                 background-color: {PANEL_COLOR.name()};
                 border-top: 1px solid #504945;
             }}
+            QMenuBar {{
+                background-color: {PANEL_COLOR.name()};
+                color: white;
+                padding: 4px;
+                border-bottom: 1px solid #504945;
+            }}
+            QMenuBar::item {{
+                background-color: transparent;
+                padding: 8px 16px;
+                border-radius: 6px;
+                margin: 2px;
+            }}
+            QMenuBar::item:selected {{
+                background-color: #665C54;
+            }}
+            QMenu {{
+                background-color: {PANEL_COLOR.name()};
+                color: white;
+                border: 1px solid #504945;
+                border-radius: 6px;
+                padding: 4px;
+            }}
+            QMenu::item {{
+                padding: 8px 30px 8px 25px;
+                border-radius: 4px;
+                margin: 1px;
+            }}
+            QMenu::item:selected {{
+                background-color: #665C54;
+            }}
+            QMenu::separator {{
+                height: 1px;
+                background-color: #504945;
+                margin: 4px 8px;
+            }}
         """)
 
     def _create_right_panel(self) -> QFrame:
@@ -669,44 +739,6 @@ class MainWindow(QMainWindow):
 
     def _create_menu_bar(self):
         """Create and configure the enhanced menu bar."""
-        self.setStyleSheet(self.styleSheet() + f"""
-            QMenuBar {{
-                background-color: {PANEL_COLOR.name()};
-                color: white;
-                padding: 4px;
-                border-bottom: 1px solid #504945;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 8px 16px;
-                border-radius: 6px;
-                margin: 2px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: #665C54;
-            }}
-            QMenu {{
-                background-color: {PANEL_COLOR.name()};
-                color: white;
-                border: 1px solid #504945;
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 8px 30px 8px 25px;
-                border-radius: 4px;
-                margin: 1px;
-            }}
-            QMenu::item:selected {{
-                background-color: #665C54;
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: #504945;
-                margin: 4px 8px;
-            }}
-        """)
-
         menubar = self.menuBar()
         # File menu
         self._create_file_menu(menubar)
@@ -837,66 +869,65 @@ class MainWindow(QMainWindow):
 
     def _show_shortcuts(self):
         """Show keyboard shortcuts."""
-        self.shortcuts_msg = QMessageBox(self)
-        self.shortcuts_msg.setWindowTitle("Keyboard Shortcuts")
-        self.shortcuts_msg.setIcon(QMessageBox.Information)
-        self.shortcuts_msg.setText("DeepCore Chess Shortcuts")
-        self.shortcuts_msg.setInformativeText(
-            "File Operations:\n"
-            "• Ctrl+N: New Game\n"
-            "• Ctrl+O: Open Game\n"
-            "• Ctrl+S: Save Game\n"
-            "• Ctrl+Q: Exit\n\n"
-            
-            "Game Controls:\n"
-            "• Ctrl+Z: Undo Move\n"
-            "• Ctrl+Y: Redo Move\n"
-            "• F11: Toggle Fullscreen\n\n"
-            
-            "Settings:\n"
-            "• Ctrl+,: Open Preferences\n\n"
-            
-            "View:\n"
-            "• F11: Fullscreen Mode"
-        )
+        # Build the dialog once, later opens only show it again
+        if self.shortcuts_msg is None:
+            self.shortcuts_msg = QMessageBox(self)
+            self.shortcuts_msg.setWindowTitle("Keyboard Shortcuts")
+            self.shortcuts_msg.setIcon(QMessageBox.Information)
+            self.shortcuts_msg.setText("DeepCore Chess Shortcuts")
+            self.shortcuts_msg.setInformativeText(SHORTCUTS_TEXT)
+
         self.shortcuts_msg.exec()
 
     def _show_about(self) -> None:
         """Show an About dialog with detailed information and clickable links."""
 
-        self.about_box = QMessageBox(self)
-        self.about_box.setWindowTitle("About DeepCore")
+        # Build the dialog once: the icon is decoded and the rich text parsed on first open only
+        if self.about_box is None:
+            self.about_box = QMessageBox(self)
+            self.about_box.setWindowTitle("About DeepCore")
 
-        # Check if APP_ICON exists and is valid
-        if APP_ICON and os.path.exists(APP_ICON):
-            self.about_box.setIconPixmap(QIcon(APP_ICON).pixmap(64, 64))
+            # Check if APP_ICON exists and is valid
+            if APP_ICON and os.path.exists(APP_ICON):
+                self.about_box.setIconPixmap(QIcon(APP_ICON).pixmap(64, 64))
 
-        # Set the main text
-        self.about_box.setTextFormat(Qt.RichText)
-        self.about_box.setText(ABOUT_TEXT)
+            # Set the main text
+            self.about_box.setTextFormat(Qt.RichText)
+            self.about_box.setText(ABOUT_TEXT)
 
-        # Informative text with clickable links for website and GitHub
-        self.about_box.setInformativeText(LINKS_TEXT)
+            # Informative text with clickable links for website and GitHub
+            self.about_box.setInformativeText(LINKS_TEXT)
 
-        # Add Donate button
-        donate_button = self.about_box.addButton("Donate", QMessageBox.ActionRole)
-        self.about_box.addButton(QMessageBox.Ok)
+            # Add Donate button
+            self._about_donate_button = self.about_box.addButton("Donate", QMessageBox.ActionRole)
+            self.about_box.addButton(QMessageBox.Ok)
 
         # Show the dialog modally
         self.about_box.exec()
 
         # If Donate clicked, open donation URL
-        if self.about_box.clickedButton() == donate_button:
+        if self.about_box.clickedButton() == self._about_donate_button:
             donation_url: str = DONATE_URL  # Replace it with your real URL
             QDesktopServices.openUrl(QUrl(donation_url))
 
     def _update(self) -> None:
         """ This method will update stuff"""
 
-        # update the turn label
-        play_turn: str = self.chess_board.game.current_turn
-        self.turn_label.setText(f"{play_turn.capitalize()}' turn")
-        self.turn_label.setStyleSheet(f"color: {play_turn};")
+        # Show the update widget once the background update check has answered
+        if self._update_check is not None and self._update_check.done():
+            # A failed check must never raise inside this timer slot
+            if self._update_check.exception() is None and self._update_check.result():
+                self.update_widget = UpdateWidget()
+            self._update_check = None
+
+        turn = self.chess_board.game.current_turn
+        if turn == self._last_turn:
+            return
+        self._last_turn = turn
+
+        # update the turn label from the precomputed text and style tables
+        self.turn_label.setText(TURN_TEXT[turn])
+        self.turn_label.setStyleSheet(TURN_STYLE[turn])
 
 
 
@@ -943,6 +974,11 @@ class UpdateWidget(QWidget):
     def __init__(self):
         super().__init__(parent=None)
 
+        # Drag state: last applied global mouse position, and the latest one waiting to be applied
+        self.old_pos: QPoint | None = None
+        self._drag_pos: QPoint | None = None
+        self._move_pending: bool = False
+
         # Set up the Updater window
         self.setFixedSize(500, 120)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
@@ -977,12 +1013,23 @@ class UpdateWidget(QWidget):
         self.old_pos = event.globalPos()
 
     def mouseMoveEvent(self, event):
-        try:
-            delta = QPoint(event.globalPos() - self.old_pos)
-            self.move(self.x() + delta.x(), self.y() + delta.y())
-            self.old_pos = event.globalPos()
-        except TypeError:
-            pass
+        if self.old_pos is None:
+            return
+
+        # Only keep the latest position, mouse moves are coalesced into one window move per event loop pass
+        self._drag_pos = event.globalPos()
+        if not self._move_pending:
+            self._move_pending = True
+            QTimer.singleShot(0, self._apply_drag)
+
+    def _apply_drag(self) -> None:
+        """ This method will move the window by the mouse movement since the last applied move"""
+        self._move_pending = False
+
+        pos = self._drag_pos
+        old_pos = self.old_pos
+        self.move(self.x() + pos.x() - old_pos.x(), self.y() + pos.y() - old_pos.y())
+        self.old_pos = pos
 
     def _install(self) -> None:
         """ This method will start software update"""
@@ -996,6 +1043,9 @@ class UpdateWidget(QWidget):
 def __main__() -> None:
     """ This function will start the DeepCore interface"""
 
+    # Define start time of execution
+    s_time: float = perf_counter()
+
     # Create QApplication object
     app: QApplication = QApplication(sys.argv)
 
@@ -1003,7 +1053,7 @@ def __main__() -> None:
     window = MainWindow()
     window.show()
 
-    print(f"Executed in : {perf_counter() - S_TIME:.4f} s")
+    print(f"Executed in : {perf_counter() - s_time:.4f} s")
     sys.exit(app.exec_())
 
 
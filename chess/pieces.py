@@ -14,35 +14,73 @@ license : MIT
 import sys
 from .utils import *
 from .const import *
+from .bitboard import RAYS, KNIGHT_TARGETS, KING_TARGETS, PAWN_PUSH_TARGETS, PAWN_CAPTURE_TARGETS
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, List, Optional, Iterator
+
+# DEFINE PIECE MOVE CONSTANTS (module-level so they are not rebuilt on every call)
+_ROOK_DIRECTIONS: Tuple[int, ...] = (0, 1, 2, 3)  # Orthogonal ray indexes in RAYS
+_BISHOP_DIRECTIONS: Tuple[int, ...] = (4, 5, 6, 7)  # Diagonal ray indexes in RAYS
+_QUEEN_DIRECTIONS: Tuple[int, ...] = _ROOK_DIRECTIONS + _BISHOP_DIRECTIONS
+# Castling rook squares and the squares between king and rook, indexed by color * 2 + side
+_CASTLE_ROOK_SQUARES: Tuple[int, ...] = (63, 56, 7, 0)
+_CASTLE_EMPTY_SQUARES: Tuple[Tuple[int, ...], ...] = ((61, 62), (57, 58, 59), (5, 6), (1, 2, 3))
+
+
+def _slide(piece_sq: int, board: List[Optional['Piece']], directions: Tuple[int, ...],
+           own_color: int) -> Iterator[int]:
+    """Yield the sliding moves along the precomputed rays of the given directions."""
+    rays = RAYS[piece_sq]
+
+    for direction in directions:
+        for target in rays[direction]:
+            target_piece = board[target]
+
+            if target_piece is None:
+                yield target
+            elif target_piece.color != own_color:
+                yield target
+                break  # Can't move past an enemy piece after capturing
+            else:
+                break  # Blocked by own piece
 
 
 class Piece(ABC):
     """
     Abstract base class for all chess pieces.
 
-    :param color: The color of the piece ('white' or 'black')
+    :param color: The color of the piece (WHITE or BLACK)
     :param value: The point value of the piece
     """
 
-    def __init__(self, color: str, value: float):
-        if color not in ('white', 'black'):
-            raise ValueError("Color must be 'white' or 'black'")
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('color', 'key', 'value', 'captured', 'has_moved')
+
+    symbol: str = ''  # One-letter piece symbol, used to build the bitboard key
+
+    def __init__(self, color: int, value: float):
+        if color not in (WHITE, BLACK):
+            raise ValueError("Color must be WHITE or BLACK")
 
         self.color = color
+        self.key = 'wb'[color] + self.symbol  # Bitboard key, e.g. 'wp' or 'bk'
         self.value = value
         self.captured = False
         self.has_moved = False  # Track if piece has moved (useful for castling, pawn first move)
 
+    @property
+    def texture(self) -> str:
+        """The glyph used to draw the piece, looked up only when rendering."""
+        return TEXTURES[self.symbol][self.color]
+
     @abstractmethod
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional['Piece']]) -> List[Tuple[int, int]]:
+    def possible_moves(self, piece_sq: int, board: List[Optional['Piece']]) -> Iterator[int]:
         """
-        Calculate all possible moves for this piece from the given position.
+        Yield all possible moves for this piece from the given square.
 
-        :param piece_position: Current position of the piece (row, col)
-        :param board: Dictionary representing the board state
-        :return: List of valid move positions
+        :param piece_sq: Square index of the piece (row * 8 + col)
+        :param board: The 64 board squares, indexed by row * 8 + col
+        :return: Iterator over the target square indexes
         """
         pass
 
@@ -53,7 +91,7 @@ class Piece(ABC):
 
     def is_enemy_piece(self, piece: Optional['Piece']) -> bool:
         """Check if a piece is an enemy piece."""
-        return piece is not None and piece.color != self.color
+        return piece is not None and (piece.color ^ self.color) != 0
 
     @staticmethod
     def is_empty_square(piece: Optional['Piece']) -> bool:
@@ -61,290 +99,193 @@ class Piece(ABC):
         return piece is None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.color}, {self.value})"
+        return f"{self.__class__.__name__}({COLOR_NAMES[self.color]}, {self.value})"
 
 
 class Pawn(Piece):
     """Chess Pawn piece implementation."""
 
-    def __init__(self, color: str, value: float = 1.0):
-        super().__init__(color, value)
-        self.texture = WHITE_PAWN if self.color == 'white' else BLACK_PAWN
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the pawn."""
-        possible_moves = []
-        row, col = piece_position
+    __slots__ = ()
+    symbol = 'p'
 
-        # Determine move direction based on color
-        direction = 1 if self.color == 'black' else -1
-        start_row = 1 if self.color == 'black' else 6
-
-        # Forward moves
-        forward_one = (row + direction, col)
-        if self.is_valid_position(*forward_one) and self.is_empty_square(board.get(forward_one)):
-            possible_moves.append(forward_one)
+    def __init__(self, color: int, value: float = 1.0):
+        super().__init__(color, value)
 
-            # Double move from starting position
-            if row == start_row:
-                forward_two = (row + 2 * direction, col)
-                if self.is_valid_position(*forward_two) and self.is_empty_square(board.get(forward_two)):
-                    possible_moves.append(forward_two)
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the pawn."""
+        color = self.color
 
-        # Capture moves (diagonal)
-        for col_offset in [-1, 1]:
-            capture_pos = (row + direction, col + col_offset)
-            if (self.is_valid_position(*capture_pos) and
-                self.is_enemy_piece(board.get(capture_pos))):
-                possible_moves.append(capture_pos)
+        # Forward moves, precomputed for every square (the double move only from the starting row)
+        for target in PAWN_PUSH_TARGETS[color][piece_sq]:
+            if board[target] is not None:
+                break  # A blocked pawn can't move forward at all
+            yield target
 
-        return possible_moves
+        # Capture moves (diagonal), precomputed for every square
+        for target in PAWN_CAPTURE_TARGETS[color][piece_sq]:
+            target_piece = board[target]
+            if target_piece is not None and target_piece.color != color:
+                yield target
 
 
 class Knight(Piece):
     """Chess Knight piece implementation."""
 
-    def __init__(self, color: str, value: float = 3.0):
-        super().__init__(color, value)
-        self.texture = WHITE_KNIGHT if self.color == 'white' else BLACK_KNIGHT
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the knight."""
-        possible_moves = []
-        row, col = piece_position
-
-        # All possible knight moves (L-shaped)
-        knight_moves = [
-            (2, 1), (2, -1), (-2, 1), (-2, -1),
-            (1, 2), (1, -2), (-1, 2), (-1, -2)
-        ]
-
-        for dr, dc in knight_moves:
-            new_row, new_col = row + dr, col + dc
+    __slots__ = ()
+    symbol = 'n'
 
-            if self.is_valid_position(new_row, new_col):
-                target_piece = board.get((new_row, new_col))
-                if self.is_empty_square(target_piece) or self.is_enemy_piece(target_piece):
-                    possible_moves.append((new_row, new_col))
+    def __init__(self, color: int, value: float = 3.0):
+        super().__init__(color, value)
 
-        return possible_moves
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the knight."""
+        # All possible knight moves (L-shaped), precomputed for every square
+        for target in KNIGHT_TARGETS[piece_sq]:
+            target_piece = board[target]
+            if target_piece is None or target_piece.color != self.color:
+                yield target
 
 
 class Rook(Piece):
     """Chess Rook piece implementation."""
 
-    def __init__(self, color: str, value: float = 5.0):
-        super().__init__(color, value)
-        self.texture = WHITE_ROOK if self.color == "white" else BLACK_ROOK
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the rook."""
-        return self._get_line_moves(piece_position, board, [(0, 1), (1, 0), (-1, 0), (0, -1)])
-
-    def _get_line_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]], directions: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """Helper method to get moves along straight lines."""
-        possible_moves = []
-        row, col = piece_position
-
-        for dr, dc in directions:
-            current_row, current_col = row, col
-
-            while True:
-                current_row += dr
-                current_col += dc
-
-                if not self.is_valid_position(current_row, current_col):
-                    break
-
-                target_piece = board.get((current_row, current_col))
+    __slots__ = ()
+    symbol = 'r'
 
-                if self.is_empty_square(target_piece):
-                    possible_moves.append((current_row, current_col))
-                elif self.is_enemy_piece(target_piece):
-                    possible_moves.append((current_row, current_col))
-                    break  # Can't move past an enemy piece after capturing
-                else:
-                    break  # Blocked by own piece
+    def __init__(self, color: int, value: float = 5.0):
+        super().__init__(color, value)
 
-        return possible_moves
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the rook."""
+        return _slide(piece_sq, board, _ROOK_DIRECTIONS, self.color)
 
 
 class Bishop(Piece):
     """Chess Bishop piece implementation."""
 
-    def __init__(self, color: str, value: float = 3.0):
-        super().__init__(color, value)
-        self.texture = WHITE_BISHOP if self.color == 'white' else BLACK_BISHOP
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the bishop."""
-        return self._get_diagonal_moves(piece_position, board)
-
-    def _get_diagonal_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Helper method to get moves along diagonal lines."""
-        possible_moves = []
-        row, col = piece_position
-        diagonal_directions = [(1, 1), (-1, -1), (-1, 1), (1, -1)]
-
-        for dr, dc in diagonal_directions:
-            current_row, current_col = row, col
-
-            while True:
-                current_row += dr
-                current_col += dc
-
-                if not self.is_valid_position(current_row, current_col):
-                    break
-
-                target_piece = board.get((current_row, current_col))
+    __slots__ = ()
+    symbol = 'b'
 
-                if self.is_empty_square(target_piece):
-                    possible_moves.append((current_row, current_col))
-                elif self.is_enemy_piece(target_piece):
-                    possible_moves.append((current_row, current_col))
-                    break
-                else:
-                    break
+    def __init__(self, color: int, value: float = 3.0):
+        super().__init__(color, value)
 
-        return possible_moves
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the bishop."""
+        return _slide(piece_sq, board, _BISHOP_DIRECTIONS, self.color)
 
 
 class Queen(Piece):
     """Chess Queen piece implementation."""
 
-    def __init__(self, color: str, value: float = 9.0):
-        super().__init__(color, value)
-        self.texture = WHITE_QUEEN if self.color == 'white' else BLACK_QUEEN
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the queen (combination of rook and bishop moves)."""
-        possible_moves = []
-        row, col = piece_position
-
-        # Queen moves like both rook and bishop
-        all_directions = [
-            # Rook directions (horizontal/vertical)
-            (1, 0), (0, 1), (0, -1), (-1, 0),
-            # Bishop directions (diagonal)
-            (-1, -1), (1, -1), (-1, 1), (1, 1)
-        ]
-
-        for dr, dc in all_directions:
-            current_row, current_col = row, col
-
-            while True:
-                current_row += dr
-                current_col += dc
-
-                if not self.is_valid_position(current_row, current_col):
-                    break
-
-                target_piece = board.get((current_row, current_col))
+    __slots__ = ()
+    symbol = 'q'
 
-                if self.is_empty_square(target_piece):
-                    possible_moves.append((current_row, current_col))
-                elif self.is_enemy_piece(target_piece):
-                    possible_moves.append((current_row, current_col))
-                    break
-                else:
-                    break
+    def __init__(self, color: int, value: float = 9.0):
+        super().__init__(color, value)
 
-        return possible_moves
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the queen (combination of rook and bishop moves)."""
+        # Queen moves like both rook and bishop, so walk all eight rays
+        return _slide(piece_sq, board, _QUEEN_DIRECTIONS, self.color)
 
 
 class King(Piece):
     """Chess King piece implementation."""
 
-    def __init__(self, color: str, value: float = float('inf')):
-        super().__init__(color, value)
-        self.texture = WHITE_KING if color == 'white' else BLACK_KING
-
-    def possible_moves(self, piece_position: Tuple[int, int], board: Dict[Tuple[int, int], Optional[Piece]]) -> List[Tuple[int, int]]:
-        """Calculate possible moves for the king (one square in any direction)."""
-        possible_moves = []
-        row, col = piece_position
+    __slots__ = ()
+    symbol = 'k'
 
-        # King can move one square in any direction
-        king_directions = [
-            (1, 0), (0, 1), (0, -1), (-1, 0),
-            (-1, -1), (1, -1), (-1, 1), (1, 1)
-        ]
+    def __init__(self, color: int, value: float = float('inf')):
+        super().__init__(color, value)
 
-        for dr, dc in king_directions:
-            new_row, new_col = row + dr, col + dc
+    def possible_moves(self, piece_sq: int, board: List[Optional[Piece]]) -> Iterator[int]:
+        """Yield possible moves for the king (one square in any direction)."""
+        # King can move one square in any direction, precomputed for every square
+        for target in KING_TARGETS[piece_sq]:
+            target_piece = board[target]
+            if target_piece is None or target_piece.color != self.color:
+                yield target
 
-            if self.is_valid_position(new_row, new_col):
-                target_piece = board.get((new_row, new_col))
-                if self.is_empty_square(target_piece) or self.is_enemy_piece(target_piece):
-                    possible_moves.append((new_row, new_col))
+    def can_castle_kingside(self, board: List[Optional[Piece]]) -> bool:
+        """Check if kingside castling is possible."""
+        return self._can_castle(board, KINGSIDE)
 
-        return possible_moves
+    def can_castle_queenside(self, board: List[Optional[Piece]]) -> bool:
+        """Check if queenside castling is possible."""
+        return self._can_castle(board, QUEENSIDE)
 
-    def can_castle_kingside(self, board: Dict[Tuple[int, int], Optional[Piece]]) -> bool:
-        """Check if kingside castling is possible."""
+    def _can_castle(self, board: List[Optional[Piece]], side: int) -> bool:
+        """Check the king and rook have not moved and the squares between them are empty."""
         if self.has_moved:
             return False
 
-        row = 0 if self.color == 'black' else 7
-        rook_pos = (row, 7)
-        rook = board.get(rook_pos)
+        index = self.color * 2 + side
+        rook = board[_CASTLE_ROOK_SQUARES[index]]
 
         # Check if rook exists and hasn't moved
         if not isinstance(rook, Rook) or rook.has_moved:
             return False
 
         # Check if squares between king and rook are empty
-        for col in range(5, 7):
-            if board.get((row, col)) is not None:
+        for sq in _CASTLE_EMPTY_SQUARES[index]:
+            if board[sq] is not None:
                 return False
 
         return True
 
-    def can_castle_queenside(self, board: Dict[Tuple[int, int], Optional[Piece]]) -> bool:
-        """Check if queenside castling is possible."""
-        if self.has_moved:
-            return False
 
-        row = 0 if self.color == 'black' else 7
-        rook_pos = (row, 0)
-        rook = board.get(rook_pos)
+def _build_piece_pool() -> Dict[tuple, Piece]:
+    """Build one shared instance per (piece class, color, has_moved) combination."""
+    pool = {}
+    for piece_class in (Pawn, Knight, Bishop, Rook, Queen, King):
+        for color in (WHITE, BLACK):
+            for moved in (False, True):
+                piece = piece_class(color)
+                piece.has_moved = moved
+                pool[(piece_class, color, moved)] = piece
+    return pool
 
-        # Check if rook exists and hasn't moved
-        if not isinstance(rook, Rook) or rook.has_moved:
-            return False
 
-        # Check if squares between king and rook are empty
-        for col in range(1, 4):
-            if board.get((row, col)) is not None:
-                return False
+# Pieces are flyweights: they must never be mutated once pooled
+_PIECE_POOL: Dict[tuple, Piece] = _build_piece_pool()
 
-        return True
+_PIECE_CLASSES: Dict[str, type] = {
+    'pawn': Pawn,
+    'knight': Knight,
+    'bishop': Bishop,
+    'rook': Rook,
+    'queen': Queen,
+    'king': King
+}
 
 
-# # Factory function for creating pieces
-# def create_piece(piece_type: str, color: str) -> Piece:
-#     """
-#     Factory function to create chess pieces.
-#
-#     :param piece_type: Type of piece ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king')
-#     :param color: Color of piece ('white' or 'black')
-#     :return: Piece instance
-#     """
-#     piece_classes = {
-#         'pawn': Pawn,
-#         'knight': Knight,
-#         'bishop': Bishop,
-#         'rook': Rook,
-#         'queen': Queen,
-#         'king': King
-#     }
-#
-#     piece_class = piece_classes.get(piece_type.lower())
-#     if not piece_class:
-#         raise ValueError(f"Unknown piece type: {piece_type}")
-#
-#     return piece_class(color)
+def piece_instance(piece_class: type, color: int, moved: bool = False) -> Piece:
+    """
+    Get the shared instance of a piece.
+
+    :param piece_class: Class of the piece (Pawn, Knight, ...)
+    :param color: Color of piece (WHITE or BLACK)
+    :param moved: Whether the piece has already moved
+    :return: Shared Piece instance
+    """
+    return _PIECE_POOL[(piece_class, color, moved)]
+
+
+# Factory function for creating pieces
+def create_piece(piece_type: str, color: int, moved: bool = False) -> Piece:
+    """
+    Factory function to create chess pieces.
+
+    :param piece_type: Type of piece ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king')
+    :param color: Color of piece (WHITE or BLACK)
+    :param moved: Whether the piece has already moved
+    :return: Shared Piece instance
+    """
+    piece_class = _PIECE_CLASSES.get(piece_type.lower())
+    if not piece_class:
+        raise ValueError(f"Unknown piece type: {piece_type}")
 
+    return piece_instance(piece_class, color, moved)
 
 if __name__ == "__main__":
     sys.exit()
\ No newline at end of file
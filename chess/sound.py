@@ -13,7 +13,7 @@ License : MIT
 """
 
 # IMPORTS
-from PyQt5.QtMultimedia import QSound, QMediaPlayer, QMediaContent
+from PyQt5.QtMultimedia import QSoundEffect
 from PyQt5.Qt import QUrl
 from .const import *
 import sys
@@ -26,33 +26,36 @@ class SoundEngine:
         # initialize basic parameters
         self._volume = volume
 
-        # Create Media Player object
-        self._media_player = QMediaPlayer()
+        # Load every sound once, so playing it is only a 'play()' call
+        self._move_effect = self._load_effect(MOVE_SOUND)
+        self._capture_effect = self._load_effect(CAPTURE_SOUND)
+        self._effects = (self._move_effect, self._capture_effect)
+
+    def _load_effect(self, path: str) -> QSoundEffect:
+        """ This method will create a low latency sound effect for a sound file"""
+
+        effect = QSoundEffect()
+        effect.setSource(QUrl.fromLocalFile(path))
+        effect.setVolume(self._volume / 100.0)
+        return effect
 
     def play_move_sound(self):
         """ This method will play the piece move sound"""
-
-        # Set the media content
-        content = QMediaContent(QUrl.fromLocalFile(MOVE_SOUND))
-        # Set media and play it
-        self._media_player.setMedia(content)
-        self._media_player.play()
+        self._move_effect.play()
 
     def play_capture_sound(self):
         """ This method will play the piece capture sound"""
-
-        # Set the media content
-        content = QMediaContent(QUrl.fromLocalFile(CAPTURE_SOUND))
-        self._media_player.setMedia(content)
-        self._media_player.play()
+        self._capture_effect.play()
 
     def set_mute(self):
         """ This method will mute the sound"""
-        self._media_player.setMuted(True)
+        for effect in self._effects:
+            effect.setMuted(True)
 
     def set_unmute(self):
         """ This method will unmute the sound"""
-        self._media_player.setMuted(False)
+        for effect in self._effects:
+            effect.setMuted(False)
 
 
 if __name__ == "__main__":
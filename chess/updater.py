@@ -10,9 +10,12 @@ license : MIT
 import sys
 import os
 import re
+import json
 import requests
 import socket
-from .const import VERSION
+import threading
+from concurrent.futures import Future
+from .const import VERSION, LATEST_RELEASE_API, CONFIG_DIR_NAME, UPDATE_CACHE_FILE, UPDATE_TIMEOUT
 
 
 
@@ -28,8 +31,98 @@ class Updater:
     def is_new_update(cls) -> dict[str, str] | bool:
         """ This method will check if there is a new update by checking the latest version
          tag in 'DeepCore' GitHub repository and compare it with current version"""
+
+        cache = cls._load_cache()
+        headers = {"Accept": "application/vnd.github+json"}
+        # Send the stored ETag, GitHub answers 304 without a body if the release did not change
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+
+        try:
+            response = requests.get(LATEST_RELEASE_API, headers=headers, timeout=UPDATE_TIMEOUT)
+        except requests.RequestException:
+            return False
+
+        if response.status_code == 304:
+            release = cache
+        elif response.status_code == 200:
+            # A body that is not a json object is treated like a failed check
+            try:
+                data = response.json()
+                release = {
+                    "etag": response.headers.get("ETag", ""),
+                    "version": str(data.get("tag_name", "")),
+                    "url": str(data.get("html_url", "")),
+                }
+            except (ValueError, AttributeError):
+                return False
+            cls._save_cache(release)
+        else:
+            return False
+
+        if cls._parse_version(release.get("version", "")) > cls._parse_version(VERSION):
+            return {"version": release["version"], "url": release.get("url", "")}
         return False
 
+    @classmethod
+    def check_in_background(cls) -> Future:
+        """ This method will run 'is_new_update' in a worker thread, so the GUI start is not
+         blocked by the network round trip. The returned future holds its result.
+         The thread is a daemon, so closing the app never waits for a slow request"""
+        future = Future()
+        threading.Thread(target=cls._run_check, args=(future,), daemon=True).start()
+        return future
+
+    @classmethod
+    def _run_check(cls, future: Future) -> None:
+        """ This method will run 'is_new_update' and set its result, or error, on the future"""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(cls.is_new_update())
+        except Exception as error:
+            future.set_exception(error)
+
+    @staticmethod
+    def _parse_version(version: str) -> tuple:
+        """ This method will turn a version tag like 'v0.1.2' into a comparable tuple"""
+        return tuple(int(number) for number in re.findall(r"\d+", version))
+
+    @staticmethod
+    def _cache_path() -> str:
+        """ This method will return the update cache file path in the user config directory"""
+        if sys.platform == "win32":
+            config_dir = os.environ.get("APPDATA") or os.path.expanduser("~")
+        elif sys.platform == "darwin":
+            config_dir = os.path.expanduser("~/Library/Application Support")
+        else:
+            config_dir = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+        return os.path.join(config_dir, CONFIG_DIR_NAME, UPDATE_CACHE_FILE)
+
+    @classmethod
+    def _load_cache(cls) -> dict:
+        """ This method will load the cached latest release (ETag, version and url)"""
+        path = cls._cache_path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    @classmethod
+    def _save_cache(cls, release: dict) -> None:
+        """ This method will store the latest release, so the next check can be conditional"""
+        path = cls._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(release, file)
+        except OSError:
+            pass
+
     def _download_update(self) -> None:
         """ This method will download the latest version of DeepCore"""
 
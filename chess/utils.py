@@ -13,7 +13,9 @@ date : 24.05.2025
 # IMPORTS
 import sys
 import os
+import json
 import configparser
+from .const import SETTINGS_FILE, LEGACY_SETTINGS_FILE
 from dataclasses import dataclass
 
 
@@ -45,11 +47,32 @@ class Settings(Const):
 
     @classmethod
     def load_settings(cls) -> dict:
-        """ This method will load stored settings for ini file"""
+        """ This method will load stored settings from json file"""
+        if os.path.exists(SETTINGS_FILE):
+            try:
+                with open(SETTINGS_FILE, "r", encoding="utf-8") as file:
+                    return json.load(file)
+            except (OSError, ValueError):
+                return {}
+
+        # Older installs stored an ini file: parse it once and rewrite it as json
+        if os.path.exists(LEGACY_SETTINGS_FILE):
+            parser = configparser.ConfigParser()
+            parser.read(LEGACY_SETTINGS_FILE)
+            settings = {section: dict(parser[section]) for section in parser.sections()}
+            cls.save_settings(settings)
+            return settings
+
+        return {}
 
     @classmethod
-    def save_settings(cls) -> dict:
-        """ This method will save settings for ini file"""
+    def save_settings(cls, settings: dict) -> None:
+        """ This method will save settings to json file"""
+        try:
+            with open(SETTINGS_FILE, "w", encoding="utf-8") as file:
+                json.dump(settings, file, indent=4)
+        except OSError:
+            pass
 
     def _load_default_settings(self) -> dict:
         """ This method will load default settings"""
@@ -0,0 +1,50 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+@author : Aymen Brahim Djelloul
+version : 0.1
+date    : 15.10.2026
+license : MIT
+
+
+    \\ This file contain the Zobrist keys used to hash chess positions.
+     See : https://en.wikipedia.org/wiki/Zobrist_hashing
+
+"""
+
+# IMPORTS
+import sys
+import random
+from .const import BOARD_SIZE
+from .bitboard import START_BITBOARDS
+from typing import Dict, Tuple, List, Optional
+
+# DEFINE A FIXED SEED SO HASHES ARE STABLE BETWEEN RUNS
+ZOBRIST_SEED: int = 0x5EED
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# One random 64-bit key per (piece key, square)
+PIECE_KEYS: Dict[str, Tuple[int, ...]] = {
+    key: tuple(_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)) for key in START_BITBOARDS
+}
+# XORed in when black is to move
+SIDE_KEY: int = _rng.getrandbits(64)
+# One key per set of castling rights, a 4-bit mask whose bit 'color * 2 + side' is a right
+CASTLING_KEYS: Tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(16))
+
+
+def hash_board(board: List[Optional[object]]) -> int:
+    """Compute the Zobrist hash of a board from scratch."""
+    zobrist = 0
+    for sq, piece in enumerate(board):
+        if piece is not None:
+            zobrist ^= PIECE_KEYS[piece.key][sq]
+    return zobrist
+
+
+if __name__ == "__main__":
+    sys.exit(0)
@@ -24,12 +24,34 @@ import sys
 import random
 from .utils import *
 from .search import *
+from chess.const import WHITE, BLACK, KINGSIDE, QUEENSIDE
+from chess.zobrist import PIECE_KEYS, SIDE_KEY, CASTLING_KEYS, hash_board
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List, Set, Dict
 
 
 class Const:
-    pass  # Placeholder for constants (Zobrist keys, evaluation weights, etc.)
+    # Transposition table entry flags: the stored score is exact, a lower bound or an upper bound
+    TT_EXACT: int = 0
+    TT_LOWER: int = 1
+    TT_UPPER: int = 2
+    # Maximum number of transposition table entries
+    TT_SIZE: int = 1 << 20
+    # Maximum number of positions in the move generation cache
+    MOVEGEN_CACHE_SIZE: int = 1 << 20
+
+
+# Castling rights (bit 'color * 2 + side') kept by a move leaving or landing on each square:
+# the king squares clear both rights of their color, the rook corners clear their own side
+_CASTLING_KEEP: Tuple[int, ...] = tuple(
+    0b1111 & ~{
+        0: 1 << (BLACK * 2 + QUEENSIDE), 7: 1 << (BLACK * 2 + KINGSIDE),
+        4: 0b11 << (BLACK * 2),
+        56: 1 << (WHITE * 2 + QUEENSIDE), 63: 1 << (WHITE * 2 + KINGSIDE),
+        60: 0b11 << (WHITE * 2),
+    }.get(sq, 0)
+    for sq in range(64)
+)
 
 
 class DeepCore:
@@ -48,8 +70,104 @@ class DeepCore:
             "dev_mode": dev_mode,
         }
 
-        self.board = {}  # Placeholder: should be a board dictionary mapping (row, col) to Piece
-        self.turn = 'white'  # 'white' or 'black'
+        self.board = [None] * 64  # Placeholder: should be the 64 board squares (row * 8 + col) holding Pieces
+        self.turn = 0  # 0 for white, 1 for black
+
+        # Occupied square indexes of each color, indexed by color and kept in sync by make_move/undo_move
+        self._pieces_by_color: List[Set[int]] = [set(), set()]
+        # (from_sq, to_sq, captured piece, previous hash, previous castling rights)
+        # of every move played with make_move
+        self._history: List[tuple] = []
+
+        # Castling rights still available, as a 4-bit mask whose bit 'color * 2 + side' is a right
+        self._castling: int = 0
+
+        # Zobrist hash of the piece placement, side to move and castling rights, updated
+        # incrementally by make_move/undo_move
+        self._hash: int = 0
+        # Transposition table: hash -> (depth, flag, score, best_move)
+        self._tt: Dict[int, Tuple[int, int, int, tuple]] = {}
+        # Generated moves of already seen positions: hash -> list of moves
+        self._movegen_cache: Dict[int, list] = {}
+
+    def set_board(self, board: list, turn: int = 0) -> None:
+        """
+        Set the position to search from and index its pieces.
+
+        :param board: The 64 board squares (row * 8 + col) holding Pieces or None
+        :param turn: Color to move (0 for white, 1 for black)
+        """
+        self.board = list(board)
+        self.turn = turn
+        self._history.clear()
+
+        self._pieces_by_color = [set(), set()]
+        for sq, piece in enumerate(self.board):
+            if piece is not None:
+                self._pieces_by_color[piece.color].add(sq)
+
+        # A castling right is only left while its king and rook never moved from their squares
+        castling = 0
+        for color, home in ((WHITE, 56), (BLACK, 0)):
+            king = self.board[home + 4]
+            if king is None or king.key[1] != 'k' or king.color != color or king.has_moved:
+                continue
+            for side, rook_sq in ((KINGSIDE, home + 7), (QUEENSIDE, home)):
+                rook = self.board[rook_sq]
+                if rook is not None and rook.key[1] == 'r' and rook.color == color and not rook.has_moved:
+                    castling |= 1 << (color * 2 + side)
+        self._castling = castling
+
+        self._hash = hash_board(self.board) ^ (SIDE_KEY if turn else 0) ^ CASTLING_KEYS[castling]
+
+    def make_move(self, from_sq: int, to_sq: int) -> None:
+        """Play a move on the engine board, updating the piece index incrementally."""
+        board = self.board
+        piece = board[from_sq]
+        captured = board[to_sq]
+
+        board[to_sq] = piece
+        board[from_sq] = None
+
+        own = self._pieces_by_color[piece.color]
+        own.discard(from_sq)
+        own.add(to_sq)
+        if captured is not None:
+            self._pieces_by_color[captured.color].discard(to_sq)
+
+        castling = self._castling
+        self._history.append((from_sq, to_sq, captured, self._hash, castling))
+
+        # Update the hash with XORs instead of rehashing the board
+        piece_keys = PIECE_KEYS[piece.key]
+        zobrist = self._hash ^ piece_keys[from_sq] ^ piece_keys[to_sq] ^ SIDE_KEY
+        if captured is not None:
+            zobrist ^= PIECE_KEYS[captured.key][to_sq]
+
+        # Moving a king or a rook, or capturing a rook on its corner, loses castling rights
+        new_castling = castling & _CASTLING_KEEP[from_sq] & _CASTLING_KEEP[to_sq]
+        if new_castling != castling:
+            zobrist ^= CASTLING_KEYS[castling] ^ CASTLING_KEYS[new_castling]
+            self._castling = new_castling
+        self._hash = zobrist
+        self.turn ^= 1
+
+    def undo_move(self) -> None:
+        """Take back the last move played with make_move."""
+        from_sq, to_sq, captured, self._hash, self._castling = self._history.pop()
+        board = self.board
+        piece = board[to_sq]
+
+        board[from_sq] = piece
+        board[to_sq] = captured
+
+        own = self._pieces_by_color[piece.color]
+        own.discard(to_sq)
+        own.add(from_sq)
+        if captured is not None:
+            self._pieces_by_color[captured.color].add(to_sq)
+
+        self.turn ^= 1
 
     def config(self, **kwargs) -> None:
         """
@@ -68,6 +186,45 @@ class DeepCore:
         """Return the current configuration."""
         return self._config.copy()
 
+    def probe_tt(self, depth: int, alpha: int, beta: int) -> Tuple[Optional[int], Optional[tuple]]:
+        """
+        Look the current position up in the transposition table.
+
+        :param depth: Remaining search depth
+        :param alpha: Lower bound of the search window
+        :param beta: Upper bound of the search window
+        :return: (score, best_move) where score is None unless the stored entry
+                 is deep enough to cut the search, and best_move is the stored
+                 move to try first (or None)
+        """
+        entry = self._tt.get(self._hash)
+        if entry is None:
+            return None, None
+
+        entry_depth, flag, score, best_move = entry
+        if entry_depth >= depth:
+            if (flag == Const.TT_EXACT or
+                    (flag == Const.TT_LOWER and score >= beta) or
+                    (flag == Const.TT_UPPER and score <= alpha)):
+                return score, best_move
+
+        return None, best_move
+
+    def store_tt(self, depth: int, flag: int, score: int, best_move: tuple) -> None:
+        """Store the search result of the current position in the transposition table."""
+        tt = self._tt
+        entry = tt.get(self._hash)
+
+        # Keep the deeper result of the same position
+        if entry is not None and entry[0] > depth:
+            return
+
+        # Evict the oldest entry once the table is full
+        if entry is None and len(tt) >= Const.TT_SIZE:
+            del tt[next(iter(tt))]
+
+        tt[self._hash] = (depth, flag, score, best_move)
+
     def get_best_move(self) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """
         Return a randomly selected legal move for the current player.
@@ -77,15 +234,31 @@ class DeepCore:
             tuple: ((from_row, from_col), (to_row, to_col)) if a legal move is available.
                    None if no moves are found.
         """
-        legal_moves = []
+        # Transpositions reach the same position again, so reuse its moves
+        legal_moves = self._movegen_cache.get(self._hash)
+
+        if legal_moves is None:
+            board = self.board
+
+            # Only visit the squares of the side to move instead of scanning the whole board.
+            # Moves are packed as 'from_sq << 6 | to_sq', no tuple is built per move
+            legal_moves = [from_sq << 6 | to_sq
+                           for from_sq in self._pieces_by_color[self.turn]
+                           for to_sq in board[from_sq].possible_moves(from_sq, board)]
+
+            # Evict the oldest entry once the cache is full
+            cache = self._movegen_cache
+            if len(cache) >= Const.MOVEGEN_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[self._hash] = legal_moves
 
-        for position, piece in self.board.items():
-            if piece and piece.color == self.turn:
-                moves = piece.possible_moves(position, self.board)
-                for move in moves:
-                    legal_moves.append((position, move))
+        if not legal_moves:
+            return None
 
-        return random.choice(legal_moves) if legal_moves else None
+        # Only the chosen move is unpacked into positions. A single random() call picks
+        # the index, without going through random.choice's rejection sampling loop
+        move = legal_moves[int(random.random() * len(legal_moves))]
+        return divmod(move >> 6, 8), divmod(move & 63, 8)
 
 
 if __name__ == '__main__':
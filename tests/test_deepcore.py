@@ -0,0 +1,52 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+
+    \\ Tests for the engine position hash and its transposition table.
+
+"""
+
+# IMPORTS
+import unittest
+from chess.game import Game
+from engine.deepcore import DeepCore, Const
+
+
+def start_engine() -> DeepCore:
+    """An engine set on the starting position."""
+    engine = DeepCore()
+    engine.set_board(Game().board)
+    return engine
+
+
+class TestPositionHash(unittest.TestCase):
+
+    def test_lost_castling_right_changes_the_hash(self):
+        # Ng1-f3 Ng8-f6 Rh1-g1 Nf6-g8 Rg1-h1 Nf3-g1 : same placement, white lost its kingside right
+        engine = start_engine()
+        start_hash = engine._hash
+        for from_sq, to_sq in ((62, 45), (6, 21), (63, 62), (21, 6), (62, 63), (45, 62)):
+            engine.make_move(from_sq, to_sq)
+
+        self.assertEqual(engine.board, Game().board)
+        self.assertNotEqual(engine._hash, start_hash)
+
+    def test_transposition_table_does_not_mix_castling_rights(self):
+        engine = start_engine()
+        engine.store_tt(4, Const.TT_EXACT, 25, (62, 45))
+        self.assertEqual(engine.probe_tt(4, -100, 100), (25, (62, 45)))
+
+        for from_sq, to_sq in ((62, 45), (6, 21), (63, 62), (21, 6), (62, 63), (45, 62)):
+            engine.make_move(from_sq, to_sq)
+        self.assertEqual(engine.probe_tt(4, -100, 100), (None, None))
+
+        for _ in range(6):
+            engine.undo_move()
+        self.assertEqual(engine.probe_tt(4, -100, 100), (25, (62, 45)))
+
+
+if __name__ == "__main__":
+    unittest.main()
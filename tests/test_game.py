@@ -0,0 +1,174 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+
+    \\ Tests for the game rules : move making, undoing and special moves.
+
+"""
+
+# IMPORTS
+import unittest
+from chess.const import WHITE, BLACK
+from chess.game import Game, GameState
+from chess.pieces import King, Rook, Queen, Pawn, create_piece
+
+
+def play(game: Game, *moves) -> None:
+    """Play a sequence of (from_pos, to_pos) moves, failing if one is rejected."""
+    for from_pos, to_pos in moves:
+        if not game.make_move(from_pos, to_pos):
+            raise AssertionError(f"move {from_pos} -> {to_pos} was rejected")
+
+
+def empty_game(*placements, turn: int = WHITE) -> Game:
+    """Build a game whose board only holds the given (position, piece) placements."""
+    game = Game()
+    for sq in range(64):
+        game._set_square(divmod(sq, 8), None)
+    for position, piece in placements:
+        game._set_square(position, piece)
+        if isinstance(piece, King):
+            game.update_king_position(piece.color, position)
+    game.current_turn = turn
+    return game
+
+
+def snapshot(game: Game) -> tuple:
+    """Capture every part of the game state a make/undo pair must restore."""
+    return (list(game.board), dict(game.bitboards), list(game.occupancy), game.zobrist,
+            list(game.castling_rights), game.white_king_pos, game.black_king_pos,
+            game.current_turn, game.halfmove_clock, game.fullmove_number)
+
+
+def castling_game() -> Game:
+    """Kings and rooks on their starting squares, every castling right still available."""
+    return empty_game(
+        ((7, 4), create_piece('king', WHITE)), ((7, 0), create_piece('rook', WHITE)),
+        ((7, 7), create_piece('rook', WHITE)), ((0, 4), create_piece('king', BLACK)),
+        ((0, 0), create_piece('rook', BLACK)), ((0, 7), create_piece('rook', BLACK)),
+    )
+
+
+class TestCastling(unittest.TestCase):
+
+    def test_kingside_castling_round_trip(self):
+        game = castling_game()
+        before = snapshot(game)
+
+        self.assertTrue(game.make_move((7, 4), (7, 6)))
+        self.assertIsInstance(game.get_piece((7, 6)), King)
+        self.assertIsInstance(game.get_piece((7, 5)), Rook)
+        self.assertIsNone(game.get_piece((7, 4)))
+        self.assertIsNone(game.get_piece((7, 7)))
+        self.assertEqual(game.castling_rights, [False, False, True, True])
+
+        self.assertTrue(game.undo_move())
+        self.assertEqual(snapshot(game), before)
+
+    def test_queenside_castling_round_trip(self):
+        game = castling_game()
+        game.make_move((7, 7), (6, 7))  # Give black the move
+        before = snapshot(game)
+
+        self.assertTrue(game.make_move((0, 4), (0, 2)))
+        self.assertIsInstance(game.get_piece((0, 2)), King)
+        self.assertIsInstance(game.get_piece((0, 3)), Rook)
+        self.assertIsNone(game.get_piece((0, 0)))
+        self.assertEqual(game.castling_rights[2:], [False, False])
+
+        self.assertTrue(game.undo_move())
+        self.assertEqual(snapshot(game), before)
+
+    def test_rook_move_castling_rights_are_restored(self):
+        game = castling_game()
+        before = snapshot(game)
+
+        self.assertTrue(game.make_move((7, 7), (5, 7)))
+        self.assertEqual(game.castling_rights, [False, True, True, True])
+        self.assertTrue(game.undo_move())
+        self.assertEqual(snapshot(game), before)
+
+    def test_king_move_castling_rights_are_restored(self):
+        game = castling_game()
+        before = snapshot(game)
+
+        self.assertTrue(game.make_move((7, 4), (6, 4)))
+        self.assertEqual(game.castling_rights, [False, False, True, True])
+        self.assertTrue(game.undo_move())
+        self.assertEqual(snapshot(game), before)
+
+    def test_rook_capture_removes_the_castling_right(self):
+        game = castling_game()
+        game._set_square((7, 7), None)
+        game._set_square((1, 7), create_piece('rook', WHITE, True))
+        before = snapshot(game)
+
+        # Capturing the black h8 rook takes black's kingside right away
+        self.assertTrue(game.make_move((1, 7), (0, 7)))
+        self.assertFalse(game.castling_rights[BLACK * 2])
+        self.assertTrue(game.undo_move())
+        self.assertEqual(snapshot(game), before)
+
+    def test_king_two_column_jump_off_home_row_is_not_castling(self):
+        # 1.Nf3 Nf6 2.e3 b6 3.Be2 c6, then e1-g3 is not a legal king move
+        game = Game()
+        play(game, ((7, 6), (5, 5)), ((0, 6), (2, 5)), ((6, 4), (5, 4)),
+             ((1, 1), (2, 1)), ((7, 5), (6, 4)), ((1, 2), (2, 2)))
+        board_before = list(game.board)
+
+        self.assertFalse(game.make_move((7, 4), (5, 6)))
+        self.assertEqual(game.board, board_before)
+        self.assertIsInstance(game.get_piece((7, 4)), King)
+        self.assertIsNone(game.get_piece((7, 6)))
+        self.assertIsNone(game.get_piece((5, 6)))
+
+
+class TestPromotion(unittest.TestCase):
+
+    def test_promotion_round_trip(self):
+        game = empty_game(
+            ((1, 0), create_piece('pawn', WHITE, True)),
+            ((7, 4), create_piece('king', WHITE, True)),
+            ((2, 7), create_piece('king', BLACK, True)),
+        )
+        before = snapshot(game)
+
+        self.assertTrue(game.make_move((1, 0), (0, 0)))
+        self.assertIsInstance(game.get_piece((0, 0)), Queen)
+        self.assertIsNone(game.get_piece((1, 0)))
+
+        self.assertTrue(game.undo_move())
+        self.assertIsInstance(game.get_piece((1, 0)), Pawn)
+        self.assertEqual(snapshot(game), before)
+
+    def test_under_promotion(self):
+        game = empty_game(
+            ((1, 0), create_piece('pawn', WHITE, True)),
+            ((7, 4), create_piece('king', WHITE, True)),
+            ((2, 7), create_piece('king', BLACK, True)),
+        )
+        self.assertTrue(game.make_move((1, 0), (0, 0), 'knight'))
+        self.assertEqual(game.get_piece((0, 0)).symbol, 'n')
+
+
+class TestGameState(unittest.TestCase):
+
+    def test_stalemate_is_reported_past_the_fifty_move_limit(self):
+        # Black Ka8 against white Qb6 and Kc7, black to move and no legal move
+        game = empty_game(
+            ((0, 0), create_piece('king', BLACK, True)),
+            ((2, 1), create_piece('queen', WHITE, True)),
+            ((1, 2), create_piece('king', WHITE, True)),
+            turn=BLACK,
+        )
+        game.halfmove_clock = 120
+
+        game.update_game_state()
+        self.assertEqual(game.game_state, GameState.STALEMATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+
+    \\ Perft tests : count the leaf nodes of the legal move tree and compare
+     them with the known values. See : https://www.chessprogramming.org/Perft_Results
+
+"""
+
+# IMPORTS
+import unittest
+from chess.game import Game, unpack_move
+
+# Known node counts from the starting position, indexed by depth
+START_PERFT: tuple = (1, 20, 400, 8902, 197281)
+
+
+def perft(game: Game, depth: int) -> int:
+    """Count the leaf nodes of the legal move tree, playing and undoing every move."""
+    if depth == 0:
+        return 1
+
+    nodes = 0
+    for move in game.get_legal_moves(game.current_turn):
+        from_pos, to_pos, _ = unpack_move(move)
+        if not game.make_move(from_pos, to_pos):
+            raise AssertionError(f"legal move {from_pos} -> {to_pos} was rejected")
+        nodes += perft(game, depth - 1)
+        game.undo_move()
+    return nodes
+
+
+class TestPerft(unittest.TestCase):
+
+    def test_start_position(self):
+        for depth in range(1, 5):
+            with self.subTest(depth=depth):
+                self.assertEqual(perft(Game(), depth), START_PERFT[depth])
+
+    def test_make_undo_restores_the_start_position(self):
+        game = Game()
+        board, zobrist = list(game.board), game.zobrist
+        perft(game, 3)
+        self.assertEqual(game.board, board)
+        self.assertEqual(game.zobrist, zobrist)
+        self.assertEqual(game.move_history, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
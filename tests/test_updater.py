@@ -0,0 +1,83 @@
+"""
+This code or file is pertinent to the 'DeepCore' Project
+Copyright (c) 2024-2025, 'Aymen Brahim Djelloul'. All rights reserved.
+Use of this source code is governed by a MIT license that can be
+found in the LICENSE file.
+
+
+    \\ Tests for the update check : conditional requests with a cached ETag.
+     The HTTP calls are replaced by canned responses, no network is used.
+
+"""
+
+# IMPORTS
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    import requests
+    from chess.updater import Updater
+except ImportError:  # The updater needs 'requests' (see requirements.txt)
+    requests = None
+
+
+class FakeResponse:
+    """A canned HTTP response with the attributes the updater reads."""
+
+    def __init__(self, status_code: int, headers: dict = None, body=None, json_error: bool = False):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self._json_error = json_error
+
+    def json(self):
+        if self._json_error:
+            raise ValueError("not json")
+        return self._body
+
+
+@unittest.skipIf(requests is None, "requests is not installed")
+class TestUpdateCheck(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        cache_path = os.path.join(self._tmp.name, "deepcore", "update_cache.json")
+        patcher = mock.patch.object(Updater, "_cache_path", return_value=cache_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get(self, *responses):
+        return mock.patch("chess.updater.requests.get", side_effect=list(responses))
+
+    def test_200_then_304_uses_the_cached_etag(self):
+        release = FakeResponse(200, {"ETag": '"v2"'}, {"tag_name": "v99.0", "html_url": "https://example.invalid/r"})
+        with self._get(release, FakeResponse(304)) as get:
+            first = Updater.is_new_update()
+            second = Updater.is_new_update()
+
+        expected = {"version": "v99.0", "url": "https://example.invalid/r"}
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertNotIn("If-None-Match", get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v2"')
+
+    def test_same_version_is_not_an_update(self):
+        release = FakeResponse(200, {"ETag": '"v1"'}, {"tag_name": "v0.1", "html_url": ""})
+        with self._get(release):
+            self.assertFalse(Updater.is_new_update())
+
+    def test_bad_bodies_are_not_updates(self):
+        with self._get(FakeResponse(200, json_error=True), FakeResponse(200, body=["not", "a", "dict"])):
+            self.assertFalse(Updater.is_new_update())
+            self.assertFalse(Updater.is_new_update())
+
+    def test_network_errors_are_not_updates(self):
+        with mock.patch("chess.updater.requests.get", side_effect=requests.ConnectionError):
+            self.assertFalse(Updater.check_in_background().result())
+
+
+if __name__ == "__main__":
+    unittest.main()